@@ -0,0 +1,56 @@
+"""group active member count
+
+Revision ID: 429c15514ca5
+Revises: 472970d157f5
+Create Date: 2026-10-16 10:41:52.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '429c15514ca5'
+down_revision: Union[str, None] = '472970d157f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('groups', sa.Column('active_member_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute("""
+        UPDATE groups g SET active_member_count = (
+            SELECT count(*) FROM group_members m
+            WHERE m.group_id = g.id AND m.status = 'active'
+        )
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION group_members_active_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'INSERT' THEN
+                IF OLD.status = 'active' THEN
+                    UPDATE groups SET active_member_count = active_member_count - 1 WHERE id = OLD.group_id;
+                END IF;
+            END IF;
+            IF TG_OP <> 'DELETE' THEN
+                IF NEW.status = 'active' THEN
+                    UPDATE groups SET active_member_count = active_member_count + 1 WHERE id = NEW.group_id;
+                END IF;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER group_members_active_count
+        AFTER INSERT OR DELETE OR UPDATE OF status, group_id ON group_members
+        FOR EACH ROW EXECUTE FUNCTION group_members_active_count()
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS group_members_active_count ON group_members')
+    op.execute('DROP FUNCTION IF EXISTS group_members_active_count()')
+    op.drop_column('groups', 'active_member_count')
@@ -0,0 +1,28 @@
+"""unique group member
+
+Revision ID: 472970d157f5
+Revises: fe237cd39fd8
+Create Date: 2026-10-16 10:03:18.220914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '472970d157f5'
+down_revision: Union[str, None] = 'fe237cd39fd8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fails if duplicate (group_id, user_id) rows exist — resolve those first,
+    # they may be referenced by contributions/member_punishments.
+    op.create_unique_constraint('uix_group_member', 'group_members', ['group_id', 'user_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uix_group_member', 'group_members', type_='unique')
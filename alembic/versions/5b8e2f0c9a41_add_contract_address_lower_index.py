@@ -0,0 +1,28 @@
+"""add contract address lower index
+
+Revision ID: 5b8e2f0c9a41
+Revises: d1eb5f5b196f
+Create Date: 2026-10-16 14:20:11.604332
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8e2f0c9a41'
+down_revision: Union[str, None] = 'd1eb5f5b196f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_groups_contract_address_lower', 'groups', [sa.text('lower(contract_address)')], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_groups_contract_address_lower', table_name='groups')
@@ -0,0 +1,29 @@
+"""add pending members index
+
+Revision ID: 74e759e7441b
+Revises: 9cc99c3a41da
+Create Date: 2026-10-16 11:24:09.871352
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '74e759e7441b'
+down_revision: Union[str, None] = '9cc99c3a41da'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_group_members_pending', 'group_members', ['group_id'],
+        unique=False, postgresql_where=sa.text("status = 'pending'")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_group_members_pending', table_name='group_members')
@@ -0,0 +1,30 @@
+"""add verified contracts
+
+Revision ID: 9cc99c3a41da
+Revises: 429c15514ca5
+Create Date: 2026-10-16 11:05:27.640193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9cc99c3a41da'
+down_revision: Union[str, None] = '429c15514ca5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('verified_contracts',
+    sa.Column('address', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('address'),
+    prefixes=['UNLOGGED']
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('verified_contracts')
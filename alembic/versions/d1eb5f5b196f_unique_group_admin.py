@@ -0,0 +1,31 @@
+"""unique group admin
+
+Revision ID: d1eb5f5b196f
+Revises: 74e759e7441b
+Create Date: 2026-10-16 12:02:44.158230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1eb5f5b196f'
+down_revision: Union[str, None] = '74e759e7441b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicate (group_id, user_id) admin rows, keeping the lowest id of each
+    op.execute(
+        "DELETE FROM group_admins a USING group_admins b "
+        "WHERE a.group_id = b.group_id AND a.user_id = b.user_id AND a.id > b.id"
+    )
+    op.create_unique_constraint('uix_group_admin', 'group_admins', ['group_id', 'user_id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uix_group_admin', 'group_admins', type_='unique')
@@ -0,0 +1,32 @@
+"""add group listing indexes
+
+Revision ID: fe237cd39fd8
+Revises: 0015f16df889
+Create Date: 2026-10-16 09:12:41.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fe237cd39fd8'
+down_revision: Union[str, None] = '0015f16df889'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_groups_status_created_at', 'groups', ['status', sa.text('created_at DESC')], unique=False)
+    op.create_index(
+        'ix_groups_name_trgm', 'groups', [sa.text('lower(name) gin_trgm_ops')],
+        unique=False, postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_groups_name_trgm', table_name='groups')
+    op.drop_index('ix_groups_status_created_at', table_name='groups')
@@ -1,4 +1,5 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
@@ -35,6 +36,40 @@ print("DATABASE_URL =", repr(DATABASE_URL))
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for the group routes — same database, asyncpg driver so
+# queries don't block the event loop.
+_async_url = make_url(DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1))
+# The Supabase transaction pooler (PgBouncer, port 6543) hands each
+# transaction to whichever backend is free, so statements prepared on one
+# backend are missing on the next. Prepared-statement caching stays off
+# there; direct connections keep a cache (DB_STATEMENT_CACHE_SIZE, default 1024)
+_behind_pgbouncer = _async_url.port == 6543 or "pgbouncer" in _async_url.query
+STATEMENT_CACHE_SIZE = 0 if _behind_pgbouncer else int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024"))
+# asyncpg rejects the pgbouncer=true hint as a connect() argument. The
+# dialect's prepared-statement LRU is configured on the URL, not connect_args
+ASYNC_DATABASE_URL = _async_url.difference_update_query(["pgbouncer"]).update_query_dict(
+    {"prepared_statement_cache_size": str(STATEMENT_CACHE_SIZE)}
+)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    connect_args={
+        "server_settings": {"client_encoding": "utf8"},
+        "statement_cache_size": STATEMENT_CACHE_SIZE,
+    },
+    # Sized for event-loop concurrency: every in-flight request can hold a
+    # connection, so this is larger than the sync pool
+    pool_recycle=1800,
+    pool_size=20,
+    max_overflow=40
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Create Base class
 Base = declarative_base()
 
@@ -44,4 +79,10 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Async dependency for routes running on AsyncSession
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
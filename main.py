@@ -3,11 +3,13 @@ load_dotenv()
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import asynccontextmanager
 import uvicorn
 import logging
+import logging.handlers
+import queue
 import os
 
 # Import database and models
@@ -19,6 +21,7 @@ from routes.groups import router as groups_router
 from routes.contributions import router as contributions_router
 from auth.auth_routes import router as auth_router
 from web3_files.schedular import build_scheduler   # ← import only, don't call yet
+from web3_files.initialize import web3_service
 
 import socket
 socket.setdefaulttimeout(30)
@@ -29,6 +32,17 @@ logging.getLogger("apscheduler").setLevel(logging.DEBUG)  # ← see scheduler er
 logger = logging.getLogger(__name__)
 
 
+def start_log_listener() -> logging.handlers.QueueListener:
+    """Put root log handlers behind a queue so formatting and stdout writes
+    happen on the listener thread, not the event loop"""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
 def check_environment_variables():
     required_vars = [
         "SUPABASE_URL",
@@ -45,12 +59,16 @@ def check_environment_variables():
 # ── ONE lifespan, scheduler started here ──────────────────────────────────────
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    log_listener = start_log_listener()
     logger.info("Starting up FastAPI application...")
     try:
         check_environment_variables()
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables ready")
 
+        await web3_service.open_async_session()
+        await web3_service.ready()
+
         # ✅ Build AND start scheduler here, inside lifespan
         scheduler = build_scheduler()
         scheduler.start()
@@ -66,11 +84,18 @@ async def lifespan(app: FastAPI):
     scheduler.shutdown(wait=False)
     logger.info("🛑 Scheduler stopped")
 
+    await web3_service.close_async_session()
+
+    # Flush queued records and hand the handlers back to the root logger
+    log_listener.stop()
+    logging.getLogger().handlers = list(log_listener.handlers)
+
 
 app = FastAPI(
     title="Supabase FastAPI Backend",
     version="1.0.0",
     lifespan=lifespan,   # ← only one lifespan
+    default_response_class=ORJSONResponse,
 )
 @app.post("/debug/force-create-records")
 async def force_create_records():
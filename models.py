@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, ForeignKey, Enum, Text, UniqueConstraint, Index
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, ForeignKey, Enum, Text, UniqueConstraint, Index, DDL, event, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
@@ -151,6 +151,9 @@ class Group(Base):
     is_blockchain_synced = Column(Boolean, default=False)
     last_blockchain_sync = Column(DateTime, nullable=True)
 
+    # Maintained by the group_members_active_count trigger — don't write it from Python
+    active_member_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     # Relationships
     member_punishments = relationship("MemberPunishment", back_populates="group", cascade="all, delete-orphan")
     creator = relationship("Profile", back_populates="created_groups")
@@ -159,6 +162,19 @@ class Group(Base):
     contributions = relationship("Contribution", back_populates="group")
     notifications = relationship("Notification", back_populates="group")
 
+    __table_args__ = (
+        # Default listing: WHERE status = ? ORDER BY created_at DESC LIMIT ?
+        Index("ix_groups_status_created_at", "status", created_at.desc()),
+        # Substring search on lower(name) LIKE '%...%'
+        Index("ix_groups_name_trgm", text("lower(name) gin_trgm_ops"), postgresql_using="gin"),
+        # Chain sync matches lower(contract_address) = ANY(:addrs)
+        Index("ix_groups_contract_address_lower", text("lower(contract_address)")),
+    )
+
+
+# The trigram index needs pg_trgm before the table is created
+event.listen(Group.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
 
 class GroupMember(Base):
     __tablename__ = "group_members"
@@ -178,6 +194,40 @@ class GroupMember(Base):
     contributions = relationship("Contribution", back_populates="member")
     punishments = relationship("MemberPunishment", back_populates="member", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        UniqueConstraint("group_id", "user_id", name="uix_group_member"),
+        # Pending rows are a small slice of the table; index only those
+        Index(
+            "ix_group_members_pending", "group_id",
+            postgresql_where=text("status = 'pending'")
+        ),
+    )
+
+
+# Keep groups.active_member_count in step with member status transitions
+event.listen(GroupMember.__table__, "after_create", DDL("""
+CREATE OR REPLACE FUNCTION group_members_active_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        IF OLD.status = 'active' THEN
+            UPDATE groups SET active_member_count = active_member_count - 1 WHERE id = OLD.group_id;
+        END IF;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        IF NEW.status = 'active' THEN
+            UPDATE groups SET active_member_count = active_member_count + 1 WHERE id = NEW.group_id;
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""))
+event.listen(GroupMember.__table__, "after_create", DDL("""
+CREATE TRIGGER group_members_active_count
+AFTER INSERT OR DELETE OR UPDATE OF status, group_id ON group_members
+FOR EACH ROW EXECUTE FUNCTION group_members_active_count()
+"""))
+
 class GroupAdmin(Base):
     __tablename__ = "group_admins"
     
@@ -191,6 +241,10 @@ class GroupAdmin(Base):
     group = relationship("Group", back_populates="admins")
     user = relationship("Profile", back_populates="admin_roles")
 
+    __table_args__ = (
+        UniqueConstraint("group_id", "user_id", name="uix_group_admin"),
+    )
+
 class Contribution(Base):
     __tablename__ = "contributions"
     
@@ -247,4 +301,16 @@ class MemberPunishment(Base):
 
     # Relationships
     group = relationship("Group", back_populates="member_punishments")
-    member = relationship("GroupMember", back_populates="punishments")
\ No newline at end of file
+    member = relationship("GroupMember", back_populates="punishments")
+
+
+class VerifiedContract(Base):
+    """Snapshot of the factory's on-chain group set, refreshed by the scheduler.
+
+    UNLOGGED: it is rebuilt from the chain every few seconds, so there's no
+    point paying for WAL on it.
+    """
+    __tablename__ = "verified_contracts"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+
+    address = Column(String, primary_key=True)  # lowercased
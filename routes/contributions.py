@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc, asc, and_
 from typing import List, Optional
@@ -10,13 +12,22 @@ from database import get_db
 from models import Contribution, Group, GroupMember, ContributionStatus
 from schemas import ContributionCreate, ContributionUpdate, ContributionResponse
 from web3_files.web3_contribution import ContributionContractService
-from web3_files.web3_main import Web3Service
 from web3_files.initialize import contribution_contract_svc  
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+
+# Validate and serialize list responses in one pass instead of per row
+_contribution_list_adapter = TypeAdapter(List[ContributionResponse])
+
+
+def _contribution_list(contributions) -> ORJSONResponse:
+    validated = _contribution_list_adapter.validate_python(contributions, from_attributes=True)
+    return ORJSONResponse(_contribution_list_adapter.dump_python(validated, mode="json"))
+
+
 def get_contract_service() -> ContributionContractService:
     """FastAPI dependency — returns a shared ContributionContractService instance."""
-    return ContributionContractService(Web3Service())
+    return contribution_contract_svc
 
 
 class ContributionRoutes:
@@ -175,7 +186,7 @@ class ContributionRoutes:
         }
         query = query.order_by(order_func(sort_map.get(sort_by, Contribution.due_date)))
 
-        return [ContributionResponse.model_validate(c) for c in query.offset(skip).limit(limit).all()]
+        return _contribution_list(query.offset(skip).limit(limit).all())
 
     def get_contribution(
         self, contribution_id: UUID, db: Session = Depends(get_db)
@@ -401,7 +412,7 @@ class ContributionRoutes:
         sort_map = {"amount": Contribution.amount, "created_at": Contribution.created_at}
         query = query.order_by(order_func(sort_map.get(sort_by, Contribution.due_date)))
 
-        return [ContributionResponse.model_validate(c) for c in query.offset(skip).limit(limit).all()]
+        return _contribution_list(query.offset(skip).limit(limit).all())
 
     def get_group_contribution_summary(
         self, group_id: UUID, db: Session = Depends(get_db)
@@ -598,7 +609,7 @@ class ContributionRoutes:
             query = query.filter(Contribution.group_id == group_id)
 
         contributions = query.order_by(desc(Contribution.due_date)).offset(skip).limit(limit).all()
-        return [ContributionResponse.model_validate(c) for c in contributions]
+        return _contribution_list(contributions)
 
     def get_user_overdue_contributions(
         self, user_id: UUID, db: Session = Depends(get_db)
@@ -611,7 +622,7 @@ class ContributionRoutes:
             )
         ).order_by(asc(Contribution.due_date)).all()
 
-        return [ContributionResponse.model_validate(c) for c in contributions]
+        return _contribution_list(contributions)
 
     # =========================================================================
     # Member on-chain state
@@ -1,155 +1,257 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Body
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc, asc
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Body
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import func, desc, asc, select, exists, update, any_, bindparam, String, or_
 from typing import List, Optional, Union
 from uuid import UUID
+from datetime import datetime, timedelta
 import asyncio
-from datetime import datetime
+import time
 
-from database import get_db
-from models import Group, GroupMember, GroupAdmin, Profile, MemberStatus, GroupStatus
+from database import AsyncSessionLocal, get_async_db
+from models import Group, GroupMember, GroupAdmin, Profile, MemberStatus, GroupStatus, VerifiedContract
 from schemas import (
     GroupCreate, GroupUpdate, GroupResponse, GroupWithDetails,
     GroupMemberCreate, GroupMemberUpdate, GroupMemberResponse,
     GroupAdminCreate, GroupAdminResponse, BlockchainSyncResponse, TransactionResponse,
-    GroupMemberConfirmationResponse, BlockchainInfo, GroupMemberBlockchainInfo, ConfirmMemberJoinRequest
+    GroupMemberConfirmationResponse, BlockchainInfo, GroupMemberBlockchainInfo, ConfirmMemberJoinRequest,
+    ProfileResponse, ETH_ADDRESS_RE
 )
 from web3_files.web3_main import Web3Service
 from web3_files.web3_service import Web3JoinFunctions
+from eth_utils import is_checksum_address
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Gas estimates barely move between blocks; frontends poll them constantly
+GAS_ESTIMATES_TTL = 3.0
+
+# sync_blockchain_groups leaves rows alone that were marked synced within this window
+BLOCKCHAIN_SYNC_REFRESH = timedelta(minutes=5)
+
+
+def _valid_addr(address: Optional[str]) -> bool:
+    """0x-prefixed 40-hex address; mixed-case input must also carry a valid EIP-55 checksum"""
+    if not address or ETH_ADDRESS_RE.match(address) is None:
+        return False
+    body = address[2:]
+    if body.islower() or body.isupper():
+        return True
+    return is_checksum_address(address)
+
+
+# sort_by query value -> column; the regex on sort_by keeps lookups in range
+SORT_COLS = {
+    "name": Group.name,
+    "start_date": Group.start_date,
+    "contribution_amount": Group.contribution_amount,
+    "created_at": Group.created_at,
+}
+
+# Columns GroupResponse is built from; the listing selects only these
+_GROUP_LIST_COLUMNS = (
+    Group.id, Group.name, Group.description, Group.contribution_amount,
+    Group.contribution_frequency, Group.max_members, Group.start_date, Group.end_date,
+    Group.status, Group.created_by, Group.created_at, Group.updated_at,
+    Group.contract_address, Group.creation_tx_hash, Group.creation_block_number,
+    Group.active_member_count.label("member_count"),
+)
+_group_list_adapter = TypeAdapter(List[GroupResponse])
+_member_list_adapter = TypeAdapter(List[GroupMemberResponse])
+_admin_list_adapter = TypeAdapter(List[GroupAdminResponse])
+
+# Read-only member listings select just the response columns and build the
+# schemas with model_construct — no ORM identity map, no validation pass
+_MEMBER_LIST_QUERY = select(
+    GroupMember.id, GroupMember.group_id, GroupMember.user_id, GroupMember.status,
+    GroupMember.joined_at, GroupMember.left_at, Profile.display_name, Profile.email
+).join(Profile, Profile.user_id == GroupMember.user_id)
+
+
+def _member_from_row(row) -> GroupMemberResponse:
+    return GroupMemberResponse.model_construct(
+        id=row.id, group_id=row.group_id, user_id=row.user_id, status=row.status,
+        joined_at=row.joined_at, left_at=row.left_at,
+        user=ProfileResponse.model_construct(display_name=row.display_name, email=row.email)
+    )
+
+
+def _activate_member(group_id, user_id):
+    """INSERT an active membership, or flip an existing row to active, in one statement"""
+    return (
+        pg_insert(GroupMember)
+        .values(group_id=group_id, user_id=user_id, status=MemberStatus.active)
+        .on_conflict_do_update(
+            index_elements=[GroupMember.group_id, GroupMember.user_id],
+            set_={"status": MemberStatus.active}
+        )
+    )
+
+
+# Checked against the scheduler's snapshot of the factory's group set
+_VERIFIED_COLUMN = exists().where(
+    VerifiedContract.address == func.lower(Group.contract_address)
+).label("verified")
+
+# (path, handler method, methods, response_model) — registration order matters
+# for overlapping paths, so keep new routes in their section
+_ROUTES = (
+    # Core group routes
+    ("/create-with-transaction", "create_group_with_transaction", ["POST"], GroupResponse),
+    ("/", "get_groups", ["GET"], List[GroupResponse]),
+    ("/{group_id}", "get_group", ["GET"], GroupWithDetails),
+    ("/{group_id}", "update_group", ["PUT"], GroupResponse),
+    ("/{group_id}", "delete_group", ["DELETE"], None),
+
+    ("/debug/force-create-records", "force_create_records", ["POST"], None),
+
+    # Member management with Web3 integration
+    ("/{group_id}/members", "add_member", ["POST"], Union[GroupMemberResponse, TransactionResponse]),
+    ("/{group_id}/members/submit-join", "submit_member_join", ["POST"], None),
+    ("/{group_id}/members/confirm", "confirm_member_join", ["POST"], GroupMemberConfirmationResponse),
+    ("/{group_id}/members", "get_group_members", ["GET"], List[GroupMemberResponse]),
+    ("/{group_id}/members/{member_id}", "update_member", ["PUT"], GroupMemberResponse),
+    ("/{group_id}/members/{member_id}", "remove_member", ["DELETE"], None),
+
+    # Web3 transaction preparation endpoints
+    ("/prepare-transaction", "prepare_group_creation_transaction", ["POST"], None),
+    ("/{group_id}/join-transaction", "prepare_join_transaction", ["POST"], None),
+    ("/{group_id}/contribute-transaction", "prepare_contribute_transaction", ["POST"], None),
+
+    # Web3 transaction verification endpoints
+    ("/{group_id}/verify-creation", "verify_group_creation", ["POST"], None),
+    ("/{group_id}/verify-join", "verify_join_transaction", ["POST"], None),
+    ("/{group_id}/verify-contribution", "verify_contribution_transaction", ["POST"], None),
+
+    # Admin management with Web3 integration
+    ("/{group_id}/admins", "add_admin", ["POST"], GroupAdminResponse),
+    ("/{group_id}/admins", "get_group_admins", ["GET"], List[GroupAdminResponse]),
+    ("/{group_id}/admins/{admin_id}", "remove_admin", ["DELETE"], None),
+
+    # Admin approval system for blockchain groups
+    ("/{group_id}/admin/approve-join", "admin_approve_join_request", ["POST"], None),
+    ("/{group_id}/pending-members", "get_pending_members", ["GET"], None),
+
+    # User-specific routes
+    ("/user/{user_id}", "get_user_groups", ["GET"], List[GroupResponse]),
+
+    # Web3/Blockchain routes
+    ("/blockchain/sync", "sync_blockchain_groups", ["POST"], BlockchainSyncResponse),
+    ("/blockchain/stats", "get_blockchain_stats", ["GET"], None),
+    ("/blockchain/gas-estimates", "get_gas_estimates", ["GET"], None),
+    ("/creator/{creator_address}/blockchain", "get_creator_groups_blockchain", ["GET"], None),
+)
+
+
 class GroupRoutes:
     def __init__(self):
         self.router = APIRouter(prefix="/groups", tags=["groups"])
         self.web3_service = Web3JoinFunctions()
+        # (expiry, result) for get_gas_estimates; the lock makes concurrent
+        # misses share one RPC instead of all hitting the node
+        self._gas_cache = (0.0, None)
+        self._gas_lock = asyncio.Lock()
         self._register_routes()
     
     def _register_routes(self):
         """Register all group-related routes"""
-        # Core group routes
-        self.router.add_api_route("/create-with-transaction", self.create_group_with_transaction, methods=["POST"], response_model=GroupResponse)
-        self.router.add_api_route("/", self.get_groups, methods=["GET"], response_model=List[GroupResponse])
-        self.router.add_api_route("/{group_id}", self.get_group, methods=["GET"], response_model=GroupWithDetails)
-        self.router.add_api_route("/{group_id}", self.update_group, methods=["PUT"], response_model=GroupResponse)
-        self.router.add_api_route("/{group_id}", self.delete_group, methods=["DELETE"])
-
-        self.router.add_api_route("/debug/force-create-records", self.force_create_records, methods=["POST"])
-        
-        # Member management with Web3 integration
-        self.router.add_api_route("/{group_id}/members", self.add_member, methods=["POST"], response_model=Union[GroupMemberResponse, TransactionResponse])
-        self.router.add_api_route("/{group_id}/members/confirm", self.confirm_member_join, methods=["POST"], response_model=GroupMemberConfirmationResponse)
-        self.router.add_api_route("/{group_id}/members", self.get_group_members, methods=["GET"], response_model=List[GroupMemberResponse])
-        self.router.add_api_route("/{group_id}/members/{member_id}", self.update_member, methods=["PUT"], response_model=GroupMemberResponse)
-        self.router.add_api_route("/{group_id}/members/{member_id}", self.remove_member, methods=["DELETE"])
-        
-        # NEW: Web3 transaction preparation endpoints
-        self.router.add_api_route("/prepare-transaction", self.prepare_group_creation_transaction, methods=["POST"])
-        self.router.add_api_route("/{group_id}/join-transaction", self.prepare_join_transaction, methods=["POST"])
-        self.router.add_api_route("/{group_id}/contribute-transaction", self.prepare_contribute_transaction, methods=["POST"])
-        
-        # NEW: Web3 transaction verification endpoints
-        self.router.add_api_route("/{group_id}/verify-creation", self.verify_group_creation, methods=["POST"])
-        self.router.add_api_route("/{group_id}/verify-join", self.verify_join_transaction, methods=["POST"])
-        self.router.add_api_route("/{group_id}/verify-contribution", self.verify_contribution_transaction, methods=["POST"])
-        
-        # Admin management with Web3 integration
-        self.router.add_api_route("/{group_id}/admins", self.add_admin, methods=["POST"], response_model=GroupAdminResponse)
-        self.router.add_api_route("/{group_id}/admins", self.get_group_admins, methods=["GET"], response_model=List[GroupAdminResponse])
-        self.router.add_api_route("/{group_id}/admins/{admin_id}", self.remove_admin, methods=["DELETE"])
-        
-        # NEW: Admin approval system for blockchain groups
-        self.router.add_api_route("/{group_id}/admin/approve-join", self.admin_approve_join_request, methods=["POST"])
-        self.router.add_api_route("/{group_id}/pending-members", self.get_pending_members, methods=["GET"])
-        
-        # User-specific routes
-        self.router.add_api_route("/user/{user_id}", self.get_user_groups, methods=["GET"], response_model=List[GroupResponse])
-        
-        # Web3/Blockchain routes
-        self.router.add_api_route("/blockchain/sync", self.sync_blockchain_groups, methods=["POST"], response_model=BlockchainSyncResponse)
-        self.router.add_api_route("/blockchain/stats", self.get_blockchain_stats, methods=["GET"])
-        self.router.add_api_route("/blockchain/gas-estimates", self.get_gas_estimates, methods=["GET"])
-        self.router.add_api_route("/creator/{creator_address}/blockchain", self.get_creator_groups_blockchain, methods=["GET"])
+        for path, handler, methods, response_model in _ROUTES:
+            # Only pass response_model when set; an explicit None would switch
+            # off FastAPI's inference from the handler's return annotation
+            extra = {"response_model": response_model} if response_model is not None else {}
+            self.router.add_api_route(path, getattr(self, handler), methods=methods, **extra)
+
     async def force_create_records(self):
-        from database import SessionLocal
         from models import Group, GroupMember, Contribution, ContributionStatus
-        from web3_files.schedular import _active_groups, _period_due_date
+        from web3_files.schedular import _period_due_date
         from web3_files.initialize import contribution_contract_svc
-        import datetime
 
-        db = SessionLocal()
         results = []
-        try:
-            groups = _active_groups(db)
-            results.append(f"Found {len(groups)} active groups")
-
-            for group in groups:
-                members = db.query(GroupMember).filter(
-                    GroupMember.group_id == group.id,
-                    GroupMember.status == "active",
-                ).all()
-                results.append(f"Group {group.name}: {len(members)} active members")
+        async with AsyncSessionLocal() as db:
+            try:
+                groups = (await db.execute(
+                    select(Group).where(
+                        Group.status == GroupStatus.active,
+                        Group.contract_address.isnot(None),
+                    )
+                )).scalars().all()
+                results.append(f"Found {len(groups)} active groups")
+
+                for group in groups:
+                    members = (await db.execute(
+                        select(GroupMember).where(
+                            GroupMember.group_id == group.id,
+                            GroupMember.status == MemberStatus.active,
+                        )
+                    )).scalars().all()
+                    results.append(f"Group {group.name}: {len(members)} active members")
+                    
+                    for m in members:
+                        results.append(f"  member {m.id} wallet={m.wallet_address}")
+
+                    period = contribution_contract_svc.get_current_period(group.contract_address)
+                    results.append(f"  on-chain period: {period}")
+
+                    existing = set((await db.execute(
+                        select(Contribution.member_id).where(
+                            Contribution.group_id == group.id,
+                            Contribution.period == period,
+                        )
+                    )).scalars().all())
+
+                    for member in members:
+                        if not member.wallet_address:
+                            results.append(f"  SKIP {member.id} — no wallet")
+                            continue
+                        if member.id in existing:
+                            results.append(f"  SKIP {member.id} — record exists")
+                            continue
+                        db.add(Contribution(
+                            group_id=group.id,
+                            member_id=member.id,
+                            amount=group.contribution_amount,
+                            status=ContributionStatus.pending,
+                            due_date=_period_due_date(group, period),
+                            period=period,
+                        ))
+                        results.append(f"  CREATED record for {member.id}")
                 
-                for m in members:
-                    results.append(f"  member {m.id} wallet={m.wallet_address}")
-
-                period = contribution_contract_svc.get_current_period(group.contract_address)
-                results.append(f"  on-chain period: {period}")
-
-                for member in members:
-                    if not member.wallet_address:
-                        results.append(f"  SKIP {member.id} — no wallet")
-                        continue
-                    exists = db.query(Contribution).filter(
-                        Contribution.group_id == group.id,
-                        Contribution.member_id == member.id,
-                        Contribution.period == period,
-                    ).first()
-                    if exists:
-                        results.append(f"  SKIP {member.id} — record exists")
-                        continue
-                    db.add(Contribution(
-                        group_id=group.id,
-                        member_id=member.id,
-                        amount=group.contribution_amount,
-                        status=ContributionStatus.pending,
-                        due_date=_period_due_date(group, period),
-                        period=period,
-                    ))
-                    results.append(f"  CREATED record for {member.id}")
-            
-            db.commit()
-            return {"steps": results}
-        except Exception as e:
-            db.rollback()
-            return {"error": str(e), "steps": results}
-        finally:
-            db.close()
+                await db.commit()
+                return {"steps": results}
+            except Exception as e:
+                await db.rollback()
+                return {"error": str(e), "steps": results}
+
     # NEW: Web3 Transaction Preparation Endpoints
     async def prepare_group_creation_transaction(
         self, 
         group_data: GroupCreate, 
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
     ) -> dict:
         """Phase 1: Prepare transaction data for frontend signing"""
         # Verify creator exists
-        creator = db.query(Profile).filter(
-            Profile.user_id == group_data.created_by
-        ).first()
-        if not creator:
+        creator_exists = await db.scalar(select(
+            exists().where(Profile.user_id == group_data.created_by)
+        ))
+        if not creator_exists:
             raise HTTPException(status_code=404, detail="Creator profile not found")
         
         creator_address = group_data.wallet_address
         if not creator_address:
             raise HTTPException(status_code=400, detail="Wallet address is required")
         
-        if not creator_address.startswith('0x') or len(creator_address) != 42:
+        if not _valid_addr(creator_address):
             raise HTTPException(
                 status_code=400, 
                 detail="Invalid wallet address format"
             )
         
+        await db.close()  # don't hold a pooled connection across the RPC
         try:
             result = await self.web3_service.prepare_group_creation_transaction(
                 group_data, 
@@ -169,17 +271,20 @@ class GroupRoutes:
             )
 
     
-    async def prepare_join_transaction(self, group_id: UUID, user_address: str, db: Session = Depends(get_db)) -> dict:
+    async def prepare_join_transaction(self, group_id: UUID, user_address: str, db: AsyncSession = Depends(get_async_db)) -> dict:
         """Prepare a join group transaction for user to sign"""
         # Verify group exists and get contract address
-        group = db.query(Group).filter(Group.id == group_id).first()
-        if not group:
+        row = (await db.execute(
+            select(Group.contract_address).where(Group.id == group_id)
+        )).first()
+        if row is None:
             raise HTTPException(status_code=404, detail="Group not found")
-        
-        contract_address = getattr(group, 'contract_address', None)
+
+        contract_address = row.contract_address
         if not contract_address:
             raise HTTPException(status_code=400, detail="Group does not have a blockchain contract")
         
+        await db.close()  # don't hold a pooled connection across the RPC
         try:
             result = await self.web3_service.prepare_join_group_transaction(contract_address, user_address)
             if not result['success']:
@@ -195,18 +300,21 @@ class GroupRoutes:
         group_id: UUID, 
         user_address: str, 
         contribution_amount: int, 
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
     ) -> dict:
         """Prepare a contribution transaction for user to sign"""
         # Verify group exists
-        group = db.query(Group).filter(Group.id == group_id).first()
-        if not group:
+        row = (await db.execute(
+            select(Group.contract_address).where(Group.id == group_id)
+        )).first()
+        if row is None:
             raise HTTPException(status_code=404, detail="Group not found")
-        
-        contract_address = getattr(group, 'contract_address', None)
+
+        contract_address = row.contract_address
         if not contract_address:
             raise HTTPException(status_code=400, detail="Group does not have a blockchain contract")
         
+        await db.close()  # don't hold a pooled connection across the RPC
         try:
             result = await self.web3_service.prepare_contribute_transaction(
                 contract_address, user_address, contribution_amount
@@ -225,28 +333,35 @@ class GroupRoutes:
         group_id: UUID, 
         tx_hash: str, 
         creator_address: str, 
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
     ) -> dict:
         """Verify group creation transaction and update database"""
         try:
+            # Verify on chain before touching the session, so no pooled
+            # connection is checked out for the duration of the RPC
             result = await self.web3_service.verify_group_creation_transaction(tx_hash, creator_address)
             if not result['success']:
                 raise HTTPException(status_code=400, detail=result['error'])
-            
-            # Update group in database with blockchain info
-            group = db.query(Group).filter(Group.id == group_id).first()
-            if group:
-                setattr(group, 'contract_address', result['group_address'])
-                setattr(group, 'creation_tx_hash', result['tx_hash'])
-                setattr(group, 'creation_block_number', result['block_number'])
-                setattr(group, 'is_blockchain_synced', True)
-                setattr(group, 'last_blockchain_sync', datetime.utcnow())
-                db.commit()
-            
+
+            # Update group in database with blockchain info; a missing group
+            # matches no rows
+            await db.execute(
+                update(Group)
+                .where(Group.id == group_id)
+                .values(
+                    contract_address=result['group_address'],
+                    creation_tx_hash=result['tx_hash'],
+                    creation_block_number=result['block_number'],
+                    is_blockchain_synced=True,
+                    last_blockchain_sync=datetime.utcnow()
+                )
+            )
+            await db.commit()
+
             return result
-            
+
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Verification failed: {str(e)}")
     
     async def verify_join_transaction(
@@ -255,44 +370,33 @@ class GroupRoutes:
         tx_hash: str, 
         user_address: str, 
         user_id: UUID,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
     ) -> dict:
         """Verify join transaction and update member status"""
         # Get group contract address
-        group = db.query(Group).filter(Group.id == group_id).first()
-        if not group:
+        row = (await db.execute(
+            select(Group.contract_address).where(Group.id == group_id)
+        )).first()
+        if row is None:
             raise HTTPException(status_code=404, detail="Group not found")
-        
-        contract_address = getattr(group, 'contract_address', None)
+
+        contract_address = row.contract_address
         if not contract_address:
             raise HTTPException(status_code=400, detail="Group does not have a blockchain contract")
         
+        await db.close()  # don't hold a pooled connection across the RPC
         try:
             result = await self.web3_service.verify_join_transaction(tx_hash, contract_address, user_address)
             if not result['success']:
                 raise HTTPException(status_code=400, detail=result['error'])
             
-            # Update or create member record
-            existing_member = db.query(GroupMember).filter(
-                GroupMember.group_id == group_id,
-                GroupMember.user_id == user_id
-            ).first()
-            
-            if existing_member:
-                setattr(existing_member, 'status', MemberStatus.active)
-            else:
-                db_member = GroupMember(
-                    group_id=group_id,
-                    user_id=user_id,
-                    status=MemberStatus.active
-                )
-                db.add(db_member)
-            
-            db.commit()
+            # Update or create member record in one atomic upsert
+            await db.execute(_activate_member(group_id, user_id))
+            await db.commit()
             return result
-            
+
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Join verification failed: {str(e)}")
     
     async def verify_contribution_transaction(
@@ -301,18 +405,21 @@ class GroupRoutes:
         tx_hash: str, 
         user_address: str, 
         expected_amount: Optional[int] = None,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
     ) -> dict:
         """Verify contribution transaction"""
         # Get group contract address
-        group = db.query(Group).filter(Group.id == group_id).first()
-        if not group:
+        row = (await db.execute(
+            select(Group.contract_address).where(Group.id == group_id)
+        )).first()
+        if row is None:
             raise HTTPException(status_code=404, detail="Group not found")
-        
-        contract_address = getattr(group, 'contract_address', None)
+
+        contract_address = row.contract_address
         if not contract_address:
             raise HTTPException(status_code=400, detail="Group does not have a blockchain contract")
         
+        await db.close()  # don't hold a pooled connection across the RPC
         try:
             result = await self.web3_service.verify_contribution_transaction(
                 tx_hash, contract_address, user_address, expected_amount
@@ -331,26 +438,30 @@ class GroupRoutes:
         group_id: UUID, 
         applicant_address: str, 
         admin_user_id: UUID,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
     ) -> dict:
         """Admin approves a join request on the blockchain (requires admin private key in Web3Service)"""
-        # Verify group exists
-        group = db.query(Group).filter(Group.id == group_id).first()
-        if not group:
+        # Group contract and admin permission in one round trip
+        row = (await db.execute(
+            select(
+                Group.contract_address,
+                exists().where(
+                    GroupAdmin.group_id == group_id,
+                    GroupAdmin.user_id == admin_user_id
+                ).label("is_admin")
+            ).where(Group.id == group_id)
+        )).first()
+        if row is None:
             raise HTTPException(status_code=404, detail="Group not found")
-        
-        # Verify admin permissions
-        admin = db.query(GroupAdmin).filter(
-            GroupAdmin.group_id == group_id,
-            GroupAdmin.user_id == admin_user_id
-        ).first()
-        if not admin:
+
+        if not row.is_admin:
             raise HTTPException(status_code=403, detail="User is not an admin of this group")
-        
-        contract_address = getattr(group, 'contract_address', None)
+
+        contract_address = row.contract_address
         if not contract_address:
             raise HTTPException(status_code=400, detail="Group does not have a blockchain contract")
         
+        await db.close()  # don't hold a pooled connection across the RPC
         try:
             result = await self.web3_service.admin_approve_join_request(contract_address, applicant_address)
             if not result['success']:
@@ -361,24 +472,38 @@ class GroupRoutes:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Admin approval failed: {str(e)}")
     
-    def get_pending_members(self, group_id: UUID, db: Session = Depends(get_db)) -> List[GroupMemberResponse]:
+    async def get_pending_members(self, group_id: UUID, db: AsyncSession = Depends(get_async_db)) -> List[GroupMemberResponse]:
         """Get members with pending status (waiting for admin approval)"""
-        pending_members = db.query(GroupMember).filter(
-            GroupMember.group_id == group_id,
-            GroupMember.status == MemberStatus.pending
-        ).all()
-        
-        return [GroupMemberResponse.model_validate(member) for member in pending_members]
+        rows = (await db.execute(
+            _MEMBER_LIST_QUERY.where(
+                GroupMember.group_id == group_id,
+                GroupMember.status == MemberStatus.pending
+            )
+        )).all()
+
+        members = [_member_from_row(row) for row in rows]
+        return ORJSONResponse(_member_list_adapter.dump_python(members, mode="json"))
     
     # NEW: Gas estimates endpoint
     async def get_gas_estimates(self) -> dict:
         """Get current gas price estimates for frontend"""
+        expiry, cached = self._gas_cache
+        if cached is not None and time.monotonic() < expiry:
+            return cached
+
         try:
-            result = await self.web3_service.get_gas_estimates()
-            if not result['success']:
-                raise HTTPException(status_code=500, detail=result['error'])
-            
-            return result
+            async with self._gas_lock:
+                # Another request may have refreshed it while we waited
+                expiry, cached = self._gas_cache
+                if cached is not None and time.monotonic() < expiry:
+                    return cached
+
+                result = await self.web3_service.get_gas_estimates()
+                if not result['success']:
+                    raise HTTPException(status_code=500, detail=result['error'])
+
+                self._gas_cache = (time.monotonic() + GAS_ESTIMATES_TTL, result)
+                return result
             
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to get gas estimates: {str(e)}")
@@ -386,94 +511,90 @@ class GroupRoutes:
     async def create_group_with_transaction(
         self,
         group_data: GroupCreate = Body(...),
-        signed_tx_hash: str = Body(...),
-        db: Session = Depends(get_db)
+        signed_tx_hash: str = Body(...)
     ) -> GroupResponse:
         """Phase 2: Create group after transaction is signed and submitted"""
-        # Verify creator exists
-        creator = db.query(Profile).filter(
-            Profile.user_id == group_data.created_by
-        ).first()
-        if not creator:
-            raise HTTPException(status_code=404, detail="Creator profile not found")
+        # Wait for the receipt before taking a connection from the pool;
+        # confirmation can take several seconds
+        tx_result = await self.web3_service.wait_for_transaction_confirmation(signed_tx_hash)
+
+        if not tx_result['success']:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Transaction failed: {tx_result.get('error')}"
+            )
         
-        try:
-            # Wait for transaction confirmation
-            tx_result = await self.web3_service.wait_for_transaction_confirmation(
-                signed_tx_hash
+        # Extract contract address from transaction receipt
+        contract_address = tx_result.get('contract_address')
+        if not contract_address:
+            raise HTTPException(
+                status_code=500, 
+                detail="Contract address not found in transaction receipt"
             )
-            
-            if not tx_result['success']:
-                raise HTTPException(
-                    status_code=400, 
-                    detail=f"Transaction failed: {tx_result.get('error')}"
+
+        async with AsyncSessionLocal() as db:
+            # Verify creator exists
+            creator_exists = await db.scalar(select(
+                exists().where(Profile.user_id == group_data.created_by)
+            ))
+            if not creator_exists:
+                raise HTTPException(status_code=404, detail="Creator profile not found")
+
+            try:
+                # Create group in database with blockchain info
+                group_dict = group_data.model_dump()
+                group_dict.pop('wallet_address', None)
+                group_dict.pop('network_info', None)
+                
+                group_dict.update({
+                    'contract_address': contract_address,
+                    'creation_tx_hash': signed_tx_hash,
+                    'creation_block_number': tx_result.get('block_number'),
+                    'is_blockchain_synced': True,
+                    'last_blockchain_sync': datetime.utcnow()
+                })
+                
+                db_group = Group(**group_dict)
+                db.add(db_group)
+                await db.flush()  # Get the group ID without committing
+                
+                # Add creator as admin
+                admin_data = GroupAdminCreate(
+                    group_id=db_group.id,
+                    user_id=group_data.created_by
                 )
-            
-            # Extract contract address from transaction receipt
-            contract_address = tx_result.get('contract_address')
-            if not contract_address:
+                db_admin = GroupAdmin(**admin_data.model_dump())
+                db.add(db_admin)
+                
+                # Add creator as active member
+                member_data = GroupMemberCreate(
+                    group_id=db_group.id,
+                    user_id=group_data.created_by,
+                    wallet_address=group_data.wallet_address
+                )
+                db_member = GroupMember(
+                    **member_data.model_dump(), 
+                    status=MemberStatus.active
+                )
+                db.add(db_member)
+                
+                # Commit everything together
+                await db.commit()
+                await db.refresh(db_group)
+
+                return GroupResponse.model_validate(db_group)
+
+            except Exception as e:
+                await db.rollback()
                 raise HTTPException(
                     status_code=500, 
-                    detail="Contract address not found in transaction receipt"
+                    detail=f"Group creation failed: {str(e)}"
                 )
-            
-            # Create group in database with blockchain info
-            group_dict = group_data.model_dump()
-            group_dict.pop('wallet_address', None)
-            group_dict.pop('network_info', None)
-            
-            group_dict.update({
-                'contract_address': contract_address,
-                'creation_tx_hash': signed_tx_hash,
-                'creation_block_number': tx_result.get('block_number'),
-                'is_blockchain_synced': True,
-                'last_blockchain_sync': datetime.utcnow()
-            })
-            
-            db_group = Group(**group_dict)
-            db.add(db_group)
-            db.flush()  # Get the group ID without committing
-            
-            # Add creator as admin
-            admin_data = GroupAdminCreate(
-                group_id=db_group.id,
-                user_id=group_data.created_by
-            )
-            db_admin = GroupAdmin(**admin_data.model_dump())
-            db.add(db_admin)
-            
-            # Add creator as active member
-            member_data = GroupMemberCreate(
-                group_id=db_group.id,
-                user_id=group_data.created_by,
-                wallet_address=group_data.wallet_address
-            )
-            db_member = GroupMember(
-                **member_data.model_dump(), 
-                status=MemberStatus.active
-            )
-            db.add(db_member)
-            
-            # Commit everything together
-            db.commit()
-            db.refresh(db_group)
-            
-            return GroupResponse.model_validate(db_group)
-            
-        except HTTPException:
-            db.rollback()
-            raise
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(
-                status_code=500, 
-                detail=f"Group creation failed: {str(e)}"
-            )
     
     
-    def get_groups(
+    async def get_groups(
         self,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
         skip: int = Query(0, ge=0),
         limit: int = Query(100, ge=1, le=100),
         status: Optional[GroupStatus] = None,
@@ -483,92 +604,88 @@ class GroupRoutes:
         include_blockchain: bool = Query(False, description="Include blockchain verification")
     ) -> List[GroupResponse]:
         """Get all groups with filtering, pagination, and optional blockchain verification"""
-        query = db.query(Group)
-        
+        query = select(*_GROUP_LIST_COLUMNS)
+        if include_blockchain:
+            query = query.add_columns(_VERIFIED_COLUMN)
+
         # Apply filters
         if status:
-            query = query.filter(Group.status == status)
+            query = query.where(Group.status == status)
         if search:
-            query = query.filter(Group.name.ilike(f"%{search}%"))
-        
+            # lower(name) LIKE lower(...) matches the ix_groups_name_trgm index
+            query = query.where(func.lower(Group.name).like(func.lower(f"%{search}%")))
+
         # Apply sorting
         order_func = asc if sort_order == "asc" else desc
-        if sort_by == "name":
-            query = query.order_by(order_func(Group.name))
-        elif sort_by == "start_date":
-            query = query.order_by(order_func(Group.start_date))
-        elif sort_by == "contribution_amount":
-            query = query.order_by(order_func(Group.contribution_amount))
-        else:
-            query = query.order_by(order_func(Group.created_at))
-        
-        groups = query.offset(skip).limit(limit).all()
+        query = query.order_by(order_func(SORT_COLS[sort_by]))
         
-        # Add member count and blockchain info to each group
-        group_responses = []
-        for group in groups:
-            member_count = db.query(GroupMember).filter(
-                GroupMember.group_id == group.id,
-                GroupMember.status == MemberStatus.active
-            ).count()
-            
-            group_data = GroupResponse.model_validate(group)
-            group_data.member_count = member_count
-            
+        rows = (await db.execute(query.offset(skip).limit(limit))).mappings().all()
+
+        # Add blockchain info to each group
+        items = []
+        for row in rows:
+            item = dict(row)
+            verified = item.pop("verified", False)
+
             # Add blockchain verification if requested
-            if include_blockchain and group.contract_address is not None:
-                try:
-                    # Verify group still exists on blockchain
-                    blockchain_groups = asyncio.run(self.web3_service.get_blockchain_groups())
-                    contract_addr = getattr(group, 'contract_address', None)
-                    group_data.blockchain_verified = contract_addr in blockchain_groups if contract_addr else False
-                    group_data.blockchain_info = BlockchainInfo(
-                        contract_address=getattr(group, 'contract_address', None),
-                        tx_hash=getattr(group, 'creation_tx_hash', None),
-                        block_number=getattr(group, 'creation_block_number', None),
-                        verified=group_data.blockchain_verified
-                    )
-                except Exception as e:
-                    print(f"Blockchain verification error: {e}")
-                    group_data.blockchain_verified = False
-            
-            group_responses.append(group_data)
-        
-        return group_responses
+            contract_addr = row["contract_address"]
+            if include_blockchain and contract_addr is not None:
+                item["blockchain_verified"] = verified
+                item["blockchain_info"] = {
+                    "contract_address": contract_addr,
+                    "tx_hash": row["creation_tx_hash"],
+                    "block_number": row["creation_block_number"],
+                    "verified": verified
+                }
+
+            items.append(item)
+
+        # Validate once as a list and serialize directly; skips FastAPI's
+        # second response_model pass over the same data
+        group_responses = _group_list_adapter.validate_python(items)
+        return ORJSONResponse(_group_list_adapter.dump_python(group_responses, mode="json"))
     
-    def get_group(self, group_id: UUID, db: Session = Depends(get_db)) -> GroupWithDetails:
+    async def get_group(self, group_id: UUID, db: AsyncSession = Depends(get_async_db)) -> GroupWithDetails:
         """Get a specific group with full details including blockchain info"""
-        group = db.query(Group).options(
-            joinedload(Group.members).joinedload(GroupMember.user),
-            joinedload(Group.admins).joinedload(GroupAdmin.user)
-        ).filter(Group.id == group_id).first()
+        group = (await db.execute(
+            select(Group).options(
+                selectinload(Group.members).selectinload(GroupMember.user),
+                selectinload(Group.admins).selectinload(GroupAdmin.user)
+            ).where(Group.id == group_id)
+        )).scalar_one_or_none()
         
         if not group:
             raise HTTPException(status_code=404, detail="Group not found")
         
         group_details = GroupWithDetails.model_validate(group)
         logger.info(group_details)
+        await db.close()  # don't hold a pooled connection across the RPC
+        # Response models are frozen; collect the late fields and copy once
+        extra = {"member_count": group.active_member_count}
         # Add blockchain verification
         if group.contract_address is not None:
             try:
-                blockchain_groups = asyncio.run(self.web3_service.get_blockchain_groups())
-                contract_addr = getattr(group, 'contract_address', None)
-                group_details.blockchain_verified = contract_addr in blockchain_groups if contract_addr else False
-                group_details.blockchain_info = BlockchainInfo(
-                    contract_address=getattr(group, 'contract_address', None),
-                    tx_hash=getattr(group, 'creation_tx_hash', None),
-                    block_number=getattr(group, 'creation_block_number', None),
-                    verified=group_details.blockchain_verified
+                verified = await self.web3_service.verify_group_exists(
+                    group.contract_address
+                )
+                extra["blockchain_verified"] = verified
+                extra["blockchain_info"] = BlockchainInfo(
+                    contract_address=group.contract_address,
+                    tx_hash=group.creation_tx_hash,
+                    block_number=group.creation_block_number,
+                    verified=verified
                 )
             except Exception as e:
-                print(f"Blockchain verification error: {e}")
-                group_details.blockchain_verified = False
+                logger.warning("Blockchain verification failed for group %s: %s", group.id, e)
+                extra["blockchain_verified"] = False
         
-        return group_details
+        return group_details.model_copy(update=extra)
     
-    def update_group(self, group_id: UUID, group_data: GroupUpdate, db: Session = Depends(get_db)) -> GroupResponse:
+    async def update_group(self, group_id: UUID, group_data: GroupUpdate, db: AsyncSession = Depends(get_async_db)) -> GroupResponse:
         """Update a group"""
-        db_group = db.query(Group).filter(Group.id == group_id).first()
+        db_group = (await db.execute(
+            select(Group).where(Group.id == group_id)
+        )).scalar_one_or_none()
         if not db_group:
             raise HTTPException(status_code=404, detail="Group not found")
         
@@ -578,46 +695,60 @@ class GroupRoutes:
             setattr(db_group, field, value)
         
         # Update sync status
-        setattr(db_group, 'last_blockchain_sync', datetime.utcnow())
-        
-        db.commit()
-        db.refresh(db_group)
+        db_group.last_blockchain_sync = datetime.utcnow()
+
+        await db.commit()
+        await db.refresh(db_group)
         
         return GroupResponse.model_validate(db_group)
     
-    def delete_group(self, group_id: UUID, db: Session = Depends(get_db)):
+    async def delete_group(self, group_id: UUID, db: AsyncSession = Depends(get_async_db)):
         """Delete a group (database only - blockchain groups are immutable)"""
-        db_group = db.query(Group).filter(Group.id == group_id).first()
+        db_group = (await db.execute(
+            select(Group).where(Group.id == group_id)
+        )).scalar_one_or_none()
         if not db_group:
             raise HTTPException(status_code=404, detail="Group not found")
         
         # Note: We only delete from database. Blockchain groups are immutable.
         # In practice, you might want to mark the group as inactive instead
-        setattr(db_group, 'status', GroupStatus.inactive)
-        db.commit()
+        db_group.status = GroupStatus.inactive
+        await db.commit()
         
         return {"message": "Group marked as inactive (blockchain groups cannot be deleted)"}
     
     # Updated add_member method with prepare/verify pattern
-    async def add_member(self, group_id: UUID, member_data: GroupMemberCreate, db: Session = Depends(get_db)) -> Union[GroupMemberResponse, TransactionResponse]:
+    async def add_member(self, group_id: UUID, member_data: GroupMemberCreate, db: AsyncSession = Depends(get_async_db)) -> Union[GroupMemberResponse, TransactionResponse]:
             """Add a member to a group - for blockchain groups, this prepares the transaction"""
-            # Verify group exists
-            group = db.query(Group).filter(Group.id == group_id).first()
-            if not group:
+            # Group, user, existing membership and capacity in one round trip
+            group = (await db.execute(
+                select(
+                    Group.contract_address,
+                    func.coalesce(Group.max_members, 20).label("max_members"),
+                    exists().where(Profile.user_id == member_data.user_id).label("user_exists"),
+                    select(GroupMember.status).where(
+                        GroupMember.group_id == group_id,
+                        GroupMember.user_id == member_data.user_id
+                    ).scalar_subquery().label("member_status"),
+                    Group.active_member_count
+                ).where(Group.id == group_id)
+            )).first()
+            if group is None:
                 raise HTTPException(status_code=404, detail="Group not found")
-            
+
             # Verify user exists
-            user = db.query(Profile).filter(Profile.user_id == member_data.user_id).first()
-            if not user:
+            if not group.user_exists:
                 raise HTTPException(status_code=404, detail="User not found")
-            
+
             # Check if wallet address is required and provided
             wallet_address = member_data.wallet_address
             if wallet_address:
-                setattr(user, 'wallet_address', wallet_address)
-                db.add(user)
-                db.commit()
-                db.refresh(user)
+                await db.execute(
+                    update(Profile)
+                    .where(Profile.user_id == member_data.user_id)
+                    .values(wallet_address=wallet_address)
+                )
+                await db.commit()
 
             group_address = group.contract_address
             if group.contract_address is not None:  # This is a blockchain group
@@ -628,35 +759,30 @@ class GroupRoutes:
                     )
                 
                 # Validate wallet address format
-                if not wallet_address.startswith('0x') or len(wallet_address) != 42:
+                if not _valid_addr(wallet_address):
                     raise HTTPException(status_code=400, detail="Invalid wallet address format.")
             
             # Check if user is already a member on blockchain
+            await db.close()  # don't hold a pooled connection across the RPC
             existing_mem = await self.web3_service.is_member(group_address, wallet_address)
-            logger.info(f"Blockchain member details: {existing_mem}")
+            logger.info("Blockchain member details: %s", existing_mem)
             if existing_mem and existing_mem.get("exists"):
-                logger.info(f"User {wallet_address} is already a member on the blockchain.")
+                logger.info("User %s is already a member on the blockchain.", wallet_address)
                 raise HTTPException(status_code=400, detail="User already joined on blockchain")
 
             # Check if user is already a member in DB
-            existing_member = db.query(GroupMember).filter(
-                GroupMember.group_id == group_id,
-                GroupMember.user_id == member_data.user_id
-            ).first()
-            if existing_member and existing_member.status == MemberStatus.active:
+            if group.member_status == MemberStatus.active:
                 raise HTTPException(status_code=400, detail="User is already a member of this group")
-            
+
             # Check group capacity
-            active_members_count = db.query(GroupMember).filter(
-                GroupMember.group_id == group_id,
-                GroupMember.status == MemberStatus.active
-            ).count()
-            max_members = getattr(group, 'max_members', 20)
-            if active_members_count >= max_members:
+            if group.active_member_count >= group.max_members:
                 raise HTTPException(status_code=400, detail="Group is at maximum capacity")
-            
+
+            # Activate an existing (inactive/pending) membership or create a new one
+            upsert_member = _activate_member(group_id, member_data.user_id)
+
             try:
-                contract_address = getattr(group, 'contract_address', None)
+                contract_address = group.contract_address
                 if contract_address and wallet_address:
                     # 1. Prepare blockchain transaction FIRST
                     blockchain_result = await self.web3_service.prepare_join_group_transaction(
@@ -671,18 +797,8 @@ class GroupRoutes:
                         )
 
                     # 2. Only write to DB after blockchain prep succeeds
-                    if existing_member:
-                        existing_member.status = MemberStatus.active  # BUG FIX 1: was == instead of =
-                        db.add(existing_member)
-                    else:
-                        db_member = GroupMember(
-                            group_id=group_id,
-                            user_id=member_data.user_id,
-                            status=MemberStatus.active  # BUG FIX 2: was pending, should be active
-                        )
-                        db.add(db_member)
-                    
-                    db.commit()  # BUG FIX 3: commit was only inside the else block, moved outside
+                    await db.execute(upsert_member)
+                    await db.commit()
                     
                     return TransactionResponse(
                         requires_signature=True,
@@ -694,73 +810,111 @@ class GroupRoutes:
                 
                 else:
                     # Non-blockchain group — DB only
-                    db_member = GroupMember(
-                        group_id=group_id,
-                        user_id=member_data.user_id,
-                        status=MemberStatus.active
-                    )
-                    db.add(db_member)
-                    db.commit()
-                    db.refresh(db_member)
-                    
+                    db_member = await db.scalar(upsert_member.returning(GroupMember))
+                    await db.commit()
+                    await db.refresh(db_member, ["user"])
+
                     return GroupMemberResponse.model_validate(db_member)
-                
+
             except HTTPException:
-                db.rollback()
+                await db.rollback()
                 raise
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 raise HTTPException(status_code=500, detail=f"Failed to add member: {str(e)}")
 
+    async def submit_member_join(
+        self,
+        group_id: UUID,
+        body: ConfirmMemberJoinRequest,
+        background_tasks: BackgroundTasks,
+        db: AsyncSession = Depends(get_async_db)
+    ) -> dict:
+        """Accept a join tx hash as soon as it's broadcast and verify it in the background.
+
+        A successful verification is cached by the web3 service, so the later
+        /members/confirm call doesn't have to wait on the chain.
+        """
+        row = (await db.execute(
+            select(Group.contract_address, Profile.wallet_address)
+            .join(Profile, Profile.user_id == body.user_id)
+            .where(Group.id == group_id)
+        )).first()
+        await db.close()
+
+        if not row:
+            raise HTTPException(status_code=404, detail="Group or user not found")
+        if not row.contract_address:
+            raise HTTPException(status_code=400, detail="Group does not have a blockchain contract")
+        if not row.wallet_address:
+            raise HTTPException(status_code=400, detail="User wallet address not found")
+
+        background_tasks.add_task(
+            self.web3_service.prewarm_join_verification,
+            body.tx_hash,
+            row.contract_address,
+            row.wallet_address
+        )
+        return {
+            "success": True,
+            "tx_hash": body.tx_hash,
+            "message": "Transaction received; confirm once it is mined"
+        }
+
     async def confirm_member_join(
         self,
         group_id: UUID,
         body: ConfirmMemberJoinRequest,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_async_db)
     ) -> GroupMemberConfirmationResponse:
         """Confirm member join after successful blockchain transaction."""
         user_id = body.user_id
         tx_hash = body.tx_hash
         
-        logger.info(f"Starting member join confirmation - Group: {group_id}, User: {user_id}, TX: {tx_hash}")
+        logger.info("Starting member join confirmation - Group: %s, User: %s, TX: %s", group_id, user_id, tx_hash)
         
         # Fetch group
-        group = db.query(Group).filter(Group.id == group_id).first()
+        group = (await db.execute(
+            select(Group).where(Group.id == group_id)
+        )).scalar_one_or_none()
         if not group:
-            logger.error(f"Group not found: {group_id}")
+            logger.error("Group not found: %s", group_id)
             raise HTTPException(status_code=404, detail="Group not found")
         
-        logger.info(f"Group found - Contract: {getattr(group, 'contract_address', None)}")
+        logger.info("Group found - Contract: %s", group.contract_address)
         
         # Fetch user
-        user = db.query(Profile).filter(Profile.user_id == user_id).first()
+        user = (await db.execute(
+            select(Profile).where(Profile.user_id == user_id)
+        )).scalar_one_or_none()
         if not user:
-            logger.error(f"User not found: {user_id}")
+            logger.error("User not found: %s", user_id)
             raise HTTPException(status_code=404, detail="User not found")
         
-        wallet_address = getattr(user, 'wallet_address', None)
+        wallet_address = user.wallet_address
         if not wallet_address:
-            logger.error(f"User {user_id} has no wallet address")
+            logger.error("User %s has no wallet address", user_id)
             raise HTTPException(status_code=400, detail="User wallet address not found")
         
-        logger.info(f"User wallet address: {wallet_address}")
+        logger.info("User wallet address: %s", wallet_address)
         
         try:
             # Verify blockchain transaction
-            contract_address = getattr(group, 'contract_address', None)
+            contract_address = group.contract_address
             if not contract_address:
-                logger.error(f"Group {group_id} has no contract address")
+                logger.error("Group %s has no contract address", group_id)
                 raise HTTPException(status_code=400, detail="Group does not have a blockchain contract")
             
-            logger.info(f"Verifying transaction on blockchain - TX: {tx_hash}, Contract: {contract_address}, Wallet: {wallet_address}")
-            
+            logger.info("Verifying transaction on blockchain - TX: %s, Contract: %s, Wallet: %s", tx_hash, contract_address, wallet_address)
+            await db.close()  # don't hold a pooled connection across the RPC
+
             verification_result = await self.web3_service.verify_join_transaction(
                 tx_hash, 
                 contract_address, 
                 wallet_address
             )
             
-            logger.info(f"Verification result: {verification_result}")
+            logger.info("Verification result: %s", verification_result)
             
             if not verification_result['success']:
                 reason = verification_result.get('reason')
@@ -768,26 +922,12 @@ class GroupRoutes:
 
                 # ✅ If blockchain says user is already a member, sync DB anyway
                 if reason == 'already_joined' or 'already a member' in error_msg.lower():
-                    logger.warning(f"User {user_id} already a member on-chain. Syncing DB state...")
-                    
-                    existing_member = db.query(GroupMember).filter(
-                        GroupMember.group_id == group_id,
-                        GroupMember.user_id == user_id
-                    ).first()
-
-                    if not existing_member:
-                        db_member = GroupMember(
-                            group_id=group_id,
-                            user_id=user_id,
-                            status=MemberStatus.active
-                        )
-                        db.add(db_member)
-                    else:
-                        setattr(existing_member, 'status', MemberStatus.active)
-                        db_member = existing_member
+                    logger.warning("User %s already a member on-chain. Syncing DB state...", user_id)
 
-                    db.commit()
-                    db.refresh(db_member)
+                    db_member = await db.scalar(_activate_member(group_id, user_id).returning(GroupMember))
+                    await db.commit()
+                    # RETURNING filled every column; reuse the profile loaded above
+                    set_committed_value(db_member, "user", user)
 
                     blockchain_info = GroupMemberBlockchainInfo(
                         wallet_address=wallet_address,
@@ -804,35 +944,19 @@ class GroupRoutes:
                     )
 
                     return response
-                logger.error(f"Transaction verification failed: {error_msg}")
+                logger.error("Transaction verification failed: %s", error_msg)
                 raise HTTPException(
                     status_code=400,
                     detail=f"Transaction verification failed: {error_msg}"
                 ) 
             
-            # Check for existing member
-            existing_member = db.query(GroupMember).filter(
-                GroupMember.group_id == group_id,
-                GroupMember.user_id == user_id
-            ).first()
-            
-            if existing_member:
-                logger.info(f"Updating existing member status for user {user_id}")
-                setattr(existing_member, 'status', MemberStatus.active)
-                db_member = existing_member
-            else:
-                logger.info(f"Creating new member record for user {user_id}")
-                db_member = GroupMember(
-                    group_id=group_id,
-                    user_id=user_id,
-                    status=MemberStatus.active
-                )
-                db.add(db_member)
-            
-            db.commit()
-            db.refresh(db_member)
-            
-            logger.info(f"Member record saved successfully - Member ID: {db_member.id}")
+            # Insert the member or activate the existing row
+            db_member = await db.scalar(_activate_member(group_id, user_id).returning(GroupMember))
+            await db.commit()
+            # RETURNING filled every column; reuse the profile loaded above
+            set_committed_value(db_member, "user", user)
+
+            logger.info("Member record saved successfully - Member ID: %s", db_member.id)
             
             # Create blockchain info
             blockchain_info = GroupMemberBlockchainInfo(
@@ -850,79 +974,78 @@ class GroupRoutes:
                 blockchain_info=blockchain_info
             )
             
-            logger.info(f"Member join confirmed successfully - User: {user_id}, Group: {group_id}")
+            logger.info("Member join confirmed successfully - User: %s, Group: %s", user_id, group_id)
             return response
             
         except HTTPException:
-            db.rollback()
-            logger.error(f"HTTPException during member join confirmation", exc_info=True)
+            await db.rollback()
+            logger.error("HTTPException during member join confirmation", exc_info=True)
             raise
         except Exception as e:
-            db.rollback()
-            logger.error(f"Unexpected error during member join confirmation: {str(e)}", exc_info=True)
+            await db.rollback()
+            logger.error("Unexpected error during member join confirmation: %s", e, exc_info=True)
             raise HTTPException(status_code=500, detail=f"Failed to confirm member join: {str(e)}")
 
 
     
     # Rest of the methods remain the same...
-    def get_group_members(self, group_id: UUID, db: Session = Depends(get_db)) -> List[GroupMemberResponse]:
+    async def get_group_members(self, group_id: UUID, db: AsyncSession = Depends(get_async_db)) -> List[GroupMemberResponse]:
         """Get all members of a group"""
-        members = db.query(GroupMember).filter(GroupMember.group_id == group_id).all()
-        return [GroupMemberResponse.model_validate(member) for member in members]
+        rows = (await db.execute(
+            _MEMBER_LIST_QUERY.where(GroupMember.group_id == group_id)
+        )).all()
+
+        members = [_member_from_row(row) for row in rows]
+        return ORJSONResponse(_member_list_adapter.dump_python(members, mode="json"))
     
-    def update_member(self, group_id: UUID, member_id: UUID, member_data: GroupMemberUpdate, db: Session = Depends(get_db)) -> GroupMemberResponse:
+    async def update_member(self, group_id: UUID, member_id: UUID, member_data: GroupMemberUpdate, db: AsyncSession = Depends(get_async_db)) -> GroupMemberResponse:
         """Update a group member"""
-        db_member = db.query(GroupMember).filter(
-            GroupMember.id == member_id,
-            GroupMember.group_id == group_id
-        ).first()
+        db_member = await db.get(GroupMember, member_id)
         
-        if not db_member:
+        # Same 404 as before for ids that belong to another group
+        if db_member is None or db_member.group_id != group_id:
             raise HTTPException(status_code=404, detail="Member not found")
         
         # Update fields
         update_data = member_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_member, field, value)
-        
-        db.commit()
-        db.refresh(db_member)
+
+        await db.commit()
+        await db.refresh(db_member, ["user"])
         
         return GroupMemberResponse.model_validate(db_member)
     
-    def remove_member(self, group_id: UUID, member_id: UUID, db: Session = Depends(get_db)):
+    async def remove_member(self, group_id: UUID, member_id: UUID, db: AsyncSession = Depends(get_async_db)):
         """Remove a member from a group"""
-        db_member = db.query(GroupMember).filter(
-            GroupMember.id == member_id,
-            GroupMember.group_id == group_id
-        ).first()
+        db_member = await db.get(GroupMember, member_id)
         
-        if not db_member:
+        # Same 404 as before for ids that belong to another group
+        if db_member is None or db_member.group_id != group_id:
             raise HTTPException(status_code=404, detail="Member not found")
         
-        db.delete(db_member)
-        db.commit()
+        await db.delete(db_member)
+        await db.commit()
         
         return {"message": "Member removed successfully"}
     
-    def add_admin(self, group_id: UUID, admin_data: GroupAdminCreate, db: Session = Depends(get_db)) -> GroupAdminResponse:
+    async def add_admin(self, group_id: UUID, admin_data: GroupAdminCreate, db: AsyncSession = Depends(get_async_db)) -> GroupAdminResponse:
         """Add an admin to a group"""
-        # Verify group exists
-        group = db.query(Group).filter(Group.id == group_id).first()
-        if not group:
+        # Group, user and existing-admin checks as index probes in one round trip
+        checks = (await db.execute(select(
+            exists().where(Group.id == group_id).label("group_exists"),
+            exists().where(Profile.user_id == admin_data.user_id).label("user_exists"),
+            exists().where(
+                GroupAdmin.group_id == group_id,
+                GroupAdmin.user_id == admin_data.user_id
+            ).label("is_admin")
+        ))).one()
+
+        if not checks.group_exists:
             raise HTTPException(status_code=404, detail="Group not found")
-        
-        # Verify user exists
-        user = db.query(Profile).filter(Profile.user_id == admin_data.user_id).first()
-        if not user:
+        if not checks.user_exists:
             raise HTTPException(status_code=404, detail="User not found")
-        
-        # Check if user is already an admin
-        existing_admin = db.query(GroupAdmin).filter(
-            GroupAdmin.group_id == group_id,
-            GroupAdmin.user_id == admin_data.user_id
-        ).first()
-        if existing_admin:
+        if checks.is_admin:
             raise HTTPException(status_code=400, detail="User is already an admin of this group")
         
         # Create admin
@@ -932,70 +1055,98 @@ class GroupRoutes:
             assigned_by=admin_data.assigned_by
         )
         db.add(db_admin)
-        db.commit()
-        db.refresh(db_admin)
+        # id and assigned_at are client-side defaults, set at flush; the
+        # session doesn't expire on commit, so no reload is needed
+        await db.commit()
         
         return GroupAdminResponse.model_validate(db_admin)
     
-    def get_group_admins(self, group_id: UUID, db: Session = Depends(get_db)) -> List[GroupAdminResponse]:
+    async def get_group_admins(self, group_id: UUID, db: AsyncSession = Depends(get_async_db)) -> List[GroupAdminResponse]:
         """Get all admins of a group"""
-        admins = db.query(GroupAdmin).filter(GroupAdmin.group_id == group_id).all()
-        return [GroupAdminResponse.model_validate(admin) for admin in admins]
+        rows = (await db.execute(
+            select(
+                GroupAdmin.id, GroupAdmin.group_id, GroupAdmin.user_id,
+                GroupAdmin.assigned_by, GroupAdmin.assigned_at
+            ).where(GroupAdmin.group_id == group_id)
+        )).mappings().all()
+
+        admins = [GroupAdminResponse.model_construct(**row) for row in rows]
+        return ORJSONResponse(_admin_list_adapter.dump_python(admins, mode="json"))
     
-    def remove_admin(self, group_id: UUID, admin_id: UUID, db: Session = Depends(get_db)):
+    async def remove_admin(self, group_id: UUID, admin_id: UUID, db: AsyncSession = Depends(get_async_db)):
         """Remove an admin from a group"""
-        db_admin = db.query(GroupAdmin).filter(
-            GroupAdmin.id == admin_id,
-            GroupAdmin.group_id == group_id
-        ).first()
+        db_admin = await db.get(GroupAdmin, admin_id)
         
-        if not db_admin:
+        # Same 404 as before for ids that belong to another group
+        if db_admin is None or db_admin.group_id != group_id:
             raise HTTPException(status_code=404, detail="Admin not found")
         
-        db.delete(db_admin)
-        db.commit()
+        await db.delete(db_admin)
+        await db.commit()
         
         return {"message": "Admin removed successfully"}
     
-    def get_user_groups(self, user_id: UUID, db: Session = Depends(get_db)) -> List[GroupResponse]:
+    async def get_user_groups(self, user_id: UUID, db: AsyncSession = Depends(get_async_db)) -> List[GroupResponse]:
         """Get all groups for a specific user"""
-        groups = db.query(Group).join(GroupMember).filter(
-            GroupMember.user_id == user_id,
-            GroupMember.status == MemberStatus.active
-        ).all()
-        
-        return [GroupResponse.model_validate(group) for group in groups]
+        rows = (await db.execute(
+            select(*_GROUP_LIST_COLUMNS)
+            .join(Group.members)
+            .where(
+                GroupMember.user_id == user_id,
+                GroupMember.status == MemberStatus.active
+            )
+        )).mappings().all()
+
+        # Still validated: contribution_amount is a Float column behind a
+        # Decimal field and status an Enum behind a str field
+        groups = _group_list_adapter.validate_python([dict(row) for row in rows])
+        return ORJSONResponse(_group_list_adapter.dump_python(groups, mode="json"))
     
     # Web3/Blockchain methods
-    async def sync_blockchain_groups(self, db: Session = Depends(get_db)) -> BlockchainSyncResponse:
+    async def sync_blockchain_groups(self, db: AsyncSession = Depends(get_async_db)) -> BlockchainSyncResponse:
         """Sync groups from blockchain to database"""
         try:
             blockchain_groups = await self.web3_service.get_blockchain_groups()
             
             synced_count = 0
             errors = []
+
+            # Chain addresses are lowercased, stored ones may be checksummed.
+            # = ANY(:addrs) binds a single array, so the statement text (and
+            # its prepared plan) is the same however many groups the factory
+            # reports
+            known = set()
+            if blockchain_groups:
+                addrs = bindparam("addrs", list(blockchain_groups), type_=ARRAY(String))
+                known = set((await db.execute(
+                    select(func.lower(Group.contract_address))
+                    .where(func.lower(Group.contract_address) == any_(addrs))
+                )).scalars().all())
+
+                # Only rewrite rows that are stale or not yet marked synced;
+                # repeated syncs then touch nothing
+                now = datetime.utcnow()
+                await db.execute(
+                    update(Group)
+                    .where(
+                        func.lower(Group.contract_address) == any_(addrs),
+                        or_(
+                            Group.is_blockchain_synced.is_not(True),
+                            Group.last_blockchain_sync.is_(None),
+                            Group.last_blockchain_sync < now - BLOCKCHAIN_SYNC_REFRESH
+                        )
+                    )
+                    .values(last_blockchain_sync=now, is_blockchain_synced=True)
+                    .execution_options(synchronize_session=False)
+                )
+
+            for group_address in blockchain_groups - known:
+                # Log unsynced group (you might want to implement full group data retrieval)
+                logger.info("Found unsynced group: %s", group_address)
+                synced_count += 1
             
-            for group_address in blockchain_groups:
-                try:
-                    # Check if group already exists in database
-                    existing_group = db.query(Group).filter(
-                        Group.contract_address == group_address
-                    ).first()
-                    
-                    if existing_group:
-                        # Update sync timestamp
-                        setattr(existing_group, 'last_blockchain_sync', datetime.utcnow())
-                        setattr(existing_group, 'is_blockchain_synced', True)
-                    else:
-                        # Log unsynced group (you might want to implement full group data retrieval)
-                        print(f"Found unsynced group: {group_address}")
-                        synced_count += 1
-                        
-                except Exception as e:
-                    errors.append(f"Error syncing group {group_address}: {str(e)}")
-            
-            db.commit()
-            
+            await db.commit()
+
             return BlockchainSyncResponse(
                 total_blockchain_groups=len(blockchain_groups),
                 synced_count=synced_count,
@@ -1003,32 +1154,21 @@ class GroupRoutes:
             )
             
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise HTTPException(status_code=500, detail=f"Blockchain sync failed: {str(e)}")
     
     async def get_blockchain_stats(self):
         """Get blockchain statistics"""
         try:
-            all_groups = await self.web3_service.get_blockchain_groups()
-            group_counter = self.web3_service.get_group_counter()
-            network_info = await self.web3_service.get_network_info()
-            
-            return {
-                "total_groups": len(all_groups),
-                "group_counter": group_counter,
-                "factory_address": self.web3_service.factory_address,
-                "network_connected": self.web3_service.is_connected(),
-                "latest_block": self.web3_service.get_latest_block_number(),
-                "network_info": network_info
-            }
+            return await self.web3_service.get_blockchain_stats()
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error fetching blockchain stats: {str(e)}")
     
     async def get_creator_groups_blockchain(self, creator_address: str):
         """Get groups created by a specific wallet address from blockchain"""
         try:
-            # Validate Ethereum address format
-            if not creator_address.startswith('0x') or len(creator_address) != 42:
+            # Validate Ethereum address format — hex digits and checksum, not just length
+            if not _valid_addr(creator_address):
                 raise HTTPException(status_code=400, detail="Invalid Ethereum address format")
             
             groups = await self.web3_service.get_creator_groups_from_blockchain(creator_address)
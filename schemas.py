@@ -1,14 +1,69 @@
-from pydantic import BaseModel, Field, ConfigDict, field_validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, ConfigDict, StringConstraints, field_validator
+from typing import Annotated, Optional, List
 from datetime import datetime
 from uuid import UUID
 from decimal import Decimal
+from dataclasses import dataclass, field
+import functools
+import re
 from models import ContributionStatus, GroupStatus, MemberStatus, NotificationType
-from web3 import Web3
+from eth_hash.auto import keccak
+
+__all__ = [
+    "ETH_ADDRESS_RE", "AddressStr", "TxHashStr", "PositiveDecimal", "PositiveInt",
+    "OptionalPositiveDecimal", "OptionalPositiveInt",
+    "BaseSchema", "ProfileBase", "ProfileCreate", "ProfileUpdate", "ProfileResponse", "GroupBase", "GroupCreate",
+    "GroupUpdate", "BlockchainInfo", "TransactionResponse", "GroupResponse",
+    "GroupWithDetails", "GroupMemberBase", "GroupCreateWithTransaction",
+    "GroupMemberCreate", "GroupMemberUpdate", "GroupMemberResponse",
+    "GroupMemberBlockchainInfo", "GroupMemberConfirmationResponse",
+    "ConfirmMemberJoinRequest", "GroupAdminBase", "GroupAdminCreate",
+    "GroupAdminResponse", "ContributionBase", "ContributionCreate",
+    "ContributionUpdate", "ContributionResponse", "NotificationBase",
+    "NotificationCreate", "NotificationUpdate", "NotificationResponse",
+    "AvalancheTokenBase", "AvalancheTokenCreate", "AvalancheTokenUpdate",
+    "AvalancheTokenResponse", "WalletConnect", "BlockchainSyncResponse",
+]
+
+# 0x-prefixed 20-byte hex address. Schemas validate it through AddressStr
+# (pydantic-core's compiled regex); route and service code use ETH_ADDRESS_RE
+ETH_ADDRESS_RE = re.compile(r"^0x[a-fA-F0-9]{40}$")
+AddressStr = Annotated[str, StringConstraints(pattern=ETH_ADDRESS_RE.pattern)]
+# 32-byte transaction hash; the verify paths add a missing 0x themselves
+TxHashStr = Annotated[str, StringConstraints(pattern=r"^(0x)?[0-9a-fA-F]{64}$")]
+
+# Shared numeric constraints. Annotated metadata is copied into each field,
+# whereas a shared Field() default would be mutated per class by pydantic.
+# JSON mode already emits Decimal as a string, which is what the
+# ORJSONResponse paths hand to orjson (it has no Decimal support)
+PositiveDecimal = Annotated[Decimal, Field(gt=0)]
+PositiveInt = Annotated[int, Field(gt=0)]
+OptionalPositiveDecimal = Optional[PositiveDecimal]
+OptionalPositiveInt = Optional[PositiveInt]
+
+
+@functools.lru_cache(maxsize=8192)
+def _checksum(addr_lower: str) -> str:
+    """EIP-55 form of a lowercased address; the same few wallets validate over and over.
+
+    Hashes with eth_hash directly (C-backed pycryptodome keccak) rather than
+    going through web3's to_checksum_address and its input normalisation.
+    """
+    body = addr_lower[2:].encode()
+    digest = keccak(body)
+    # Nibble i of the digest is the high half of byte i//2 for even i, the low
+    # half for odd i; above 7 flips ASCII bit 5 on a-f (digits are left alone)
+    return '0x' + bytes(
+        c ^ (((c >= 0x61) & (((digest[i >> 1] >> (4 - ((i & 1) << 2))) & 0xF) > 7)) << 5)
+        for i, c in enumerate(body)
+    ).decode()
 
 # Base schemas
 class BaseSchema(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+    # Validators are built on first use, not at import; most routes only
+    # ever touch a handful of these models. *Response subclasses add
+    # frozen=True: they're built, serialised and dropped, never edited
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 # Profile schemas
 class ProfileBase(BaseSchema):
@@ -21,22 +76,23 @@ class ProfileBase(BaseSchema):
 class ProfileCreate(ProfileBase):
     user_id: UUID
 
-class ProfileUpdate(ProfileBase):
-    pass
+# Same fields, all optional already; an alias rather than a second model
+ProfileUpdate = ProfileBase
 
-class ProfileResponse(ProfileBase):
-    id: UUID
-    user_id: UUID
-    created_at: datetime
-    updated_at: datetime
+class ProfileResponse(BaseSchema):
+    """Profile summary nested in member responses"""
+    model_config = ConfigDict(frozen=True)
+
+    display_name: Optional[str]
+    email: Optional[str]
 
 # Group schemas
 class GroupBase(BaseSchema):
     name: str
     description: Optional[str] = None
-    contribution_amount: Decimal = Field(gt=0)
+    contribution_amount: PositiveDecimal
     contribution_frequency: Optional[str] = "monthly"
-    max_members: int = Field(default=20, gt=0)
+    max_members: PositiveInt = 20
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
 
@@ -44,26 +100,31 @@ class GroupCreate(GroupBase):
     name: str = Field(..., min_length=1, max_length=255)
     max_members: int = Field(default=20, ge=3, le=100)
     approval_required: Optional[bool] = False
-    wallet_address: Optional[str] = Field(None, pattern="^0x[a-fA-F0-9]{40}$")
+    wallet_address: Optional[AddressStr] = None
     network_info: Optional[dict] = None
     created_by: UUID
 class GroupUpdate(BaseSchema):
     name: Optional[str] = None
     description: Optional[str] = None
-    contribution_amount: Optional[Decimal] = Field(None, gt=0)
+    contribution_amount: OptionalPositiveDecimal = None
     contribution_frequency: Optional[str] = None
-    max_members: Optional[int] = Field(None, gt=0)
+    max_members: OptionalPositiveInt = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     status: Optional[GroupStatus] = None
 
-class BlockchainInfo(BaseModel):
+# Output-only containers built by the routes from trusted values: plain
+# slotted dataclasses, validated only where they're nested in a response model
+@dataclass(slots=True)
+class BlockchainInfo:
     contract_address: Optional[str] = None
     tx_hash: Optional[str] = None
     block_number: Optional[int] = None
     gas_used: Optional[int] = None
     verified: Optional[bool] = None
 class TransactionResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     requires_signature: bool
     transaction: dict
     message: str
@@ -72,6 +133,8 @@ class TransactionResponse(BaseModel):
 
 
 class GroupResponse(GroupBase):
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     member_count: Optional[int] = 0
     status: str
@@ -86,64 +149,48 @@ class GroupResponse(GroupBase):
     blockchain_verified: Optional[bool] = None
     blockchain_info: Optional[BlockchainInfo] = None
 
-class GroupWithDetails(GroupResponse):
-    members: List['GroupMemberResponse'] = []
-    admins: List['GroupAdminResponse'] = []
-
 # Group Member schemas
 class GroupMemberBase(BaseSchema):
     group_id: UUID
     user_id: UUID
     # wallet_address: Optional[str] = Field(None, pattern="^0x[a-fA-F0-9]{40}$")
-class GroupCreateWithTransaction(BaseModel):
-    # All GroupCreate fields
-    name: str
-    description: Optional[str] = None
-    contribution_amount: float
+class GroupCreateWithTransaction(GroupCreate):
+    # GroupCreate fields, plus the ones only this flow sends
     contribution_cycle: str
-    max_members: int
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
     category: str
-    created_by: str
     status: str
-    wallet_address: str
-    network_info: Optional[dict] = None
+    wallet_address: AddressStr
     
     # Transaction hash from signed transaction
-    signed_tx_hash: str
+    signed_tx_hash: TxHashStr
 class GroupMemberCreate(BaseSchema):
     group_id: UUID
     user_id: UUID
-    wallet_address: Optional[str] = Field(None, pattern="^0x[a-fA-F0-9]{40}$")
+    wallet_address: Optional[AddressStr] = None
 
     @field_validator("wallet_address")
     def checksum_address(cls, v):
+        if v is None:
+            return v
         try:
-            return Web3.to_checksum_address(v)
+            return _checksum(v.lower())
         except Exception:
             raise ValueError("Invalid Ethereum address")
 
 class GroupMemberUpdate(BaseSchema):
     status: Optional[MemberStatus] = None
 
-class ProfileResponse(BaseSchema):
-    display_name: Optional[str]
-    email: Optional[str]
-    class Config:
-        orm_mode = True
-
 class GroupMemberResponse(GroupMemberBase):
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     status: MemberStatus
     joined_at: datetime
     left_at: Optional[datetime] = None
     user: Optional[ProfileResponse]
 
-    class Config:
-        orm_mode = True
-
-class GroupMemberBlockchainInfo(BaseModel):
+@dataclass(slots=True)
+class GroupMemberBlockchainInfo:
     wallet_address: str
     tx_hash: str
     block_number: int
@@ -154,6 +201,8 @@ class GroupMemberConfirmationResponse(GroupMemberResponse):
     blockchain_info: GroupMemberBlockchainInfo
     
 class ConfirmMemberJoinRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     user_id: UUID
     tx_hash: str
 
@@ -166,15 +215,21 @@ class GroupAdminCreate(GroupAdminBase):
     assigned_by: Optional[UUID] = None
 
 class GroupAdminResponse(GroupAdminBase):
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     assigned_by: Optional[UUID] = None
     assigned_at: datetime
 
+class GroupWithDetails(GroupResponse):
+    members: List[GroupMemberResponse] = Field(default_factory=list)
+    admins: List[GroupAdminResponse] = Field(default_factory=list)
+
 # Contribution schemas
 class ContributionBase(BaseSchema):
     group_id: UUID
     member_id: UUID
-    amount: Decimal = Field(gt=0)
+    amount: PositiveDecimal
     due_date: datetime
     notes: Optional[str] = None
 
@@ -182,7 +237,7 @@ class ContributionCreate(ContributionBase):
     pass
 
 class ContributionUpdate(BaseSchema):
-    amount: Optional[Decimal] = Field(None, gt=0)
+    amount: OptionalPositiveDecimal = None
     due_date: Optional[datetime] = None
     paid_date: Optional[datetime] = None
     status: Optional[ContributionStatus] = None
@@ -190,6 +245,8 @@ class ContributionUpdate(BaseSchema):
     notes: Optional[str] = None
 
 class ContributionResponse(ContributionBase):
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     paid_date: Optional[datetime] = None
     status: ContributionStatus
@@ -213,6 +270,8 @@ class NotificationUpdate(BaseSchema):
     is_read: Optional[bool] = None
 
 class NotificationResponse(NotificationBase):
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     is_read: bool
     created_at: datetime
@@ -237,19 +296,22 @@ class AvalancheTokenUpdate(BaseSchema):
     last_updated: Optional[datetime] = None
 
 class AvalancheTokenResponse(AvalancheTokenBase):
+    model_config = ConfigDict(frozen=True)
+
     id: UUID
     created_at: Optional[datetime] = None
     last_updated: Optional[datetime] = None
 
     
 class WalletConnect(BaseModel):
-    wallet_address: str = Field(..., pattern="^0x[a-fA-F0-9]{40}$")
+    model_config = ConfigDict(defer_build=True)
+
+    wallet_address: AddressStr
     wallet_provider: Optional[str] = None
 
 
-class BlockchainSyncResponse(BaseModel):
+@dataclass(slots=True)
+class BlockchainSyncResponse:
     total_blockchain_groups: int
     synced_count: int
-    errors: List[str] = []
-# Update forward references
-GroupWithDetails.model_rebuild()
\ No newline at end of file
+    errors: List[str] = field(default_factory=list)
@@ -1,7 +1,8 @@
 # print_tables.py
 
 from database import Base  # or wherever your models and Base are defined
-from models import Notification, PunishmentAction, PunishmentReason, ContributionStatus, GroupStatus, MemberStatus, NotificationType, UserOAuthToken
+import models  # noqa: F401 -- registers every ORM table on Base.metadata
 
-print("Registered tables:")
-print(Base.metadata.tables.keys())
+if __name__ == "__main__":
+    print("Registered tables:")
+    print(Base.metadata.tables.keys())
@@ -0,0 +1,17 @@
+import importlib
+from decimal import Decimal
+
+import pytest
+
+
+@pytest.mark.parametrize("module", ["routes.groups", "routes.contributions"])
+def test_route_modules_import(module):
+    # Module-level TypeAdapters build their schemas at import
+    importlib.import_module(module)
+
+
+def test_decimal_amounts_serialize_as_strings():
+    from schemas import GroupUpdate
+
+    dumped = GroupUpdate(contribution_amount=Decimal("1.50")).model_dump(mode="json")
+    assert dumped["contribution_amount"] == "1.50"
@@ -0,0 +1,59 @@
+import asyncio
+from collections import OrderedDict
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import BackgroundTasks
+
+GROUP = "0x" + "11" * 20
+WALLET = "0x" + "22" * 20
+TX_HASH = "0x" + "ab" * 32
+
+
+class _FakeSession:
+    async def execute(self, _stmt):
+        row = SimpleNamespace(contract_address=GROUP, wallet_address=WALLET)
+        return SimpleNamespace(first=lambda: row)
+
+    async def close(self):
+        pass
+
+
+class _FakeCall:
+    async def call(self):
+        return (True, True, 0, 0, 0, 0)
+
+
+def test_confirm_hits_cache_after_submit_join(monkeypatch):
+    from routes.groups import GroupRoutes
+    from schemas import ConfirmMemberJoinRequest
+    from web3_files.web3_service import Web3JoinFunctions
+
+    monkeypatch.setattr(Web3JoinFunctions, "_verified_joins", OrderedDict())
+    routes = GroupRoutes()
+    service = routes.web3_service
+    rpc_verifications = []
+
+    async def mined_receipt(tx_hash, timeout):
+        return {"status": 1, "transactionHash": tx_hash}
+
+    async def verify_user_transaction(tx_hash, user_address, contract_address):
+        rpc_verifications.append(tx_hash)
+        return {"success": True, "tx_hash": tx_hash, "block_number": 1, "gas_used": 21000}
+
+    contract = SimpleNamespace(functions=SimpleNamespace(getMemberDetails=lambda _addr: _FakeCall()))
+    monkeypatch.setattr(service, "_await_receipt", mined_receipt)
+    monkeypatch.setattr(service, "verify_user_transaction", verify_user_transaction)
+    monkeypatch.setattr(service, "_get_async_group_contract", lambda _addr: contract)
+
+    async def scenario():
+        tasks = BackgroundTasks()
+        body = ConfirmMemberJoinRequest(user_id=uuid4(), tx_hash=TX_HASH)
+        await routes.submit_member_join(uuid4(), body, tasks, db=_FakeSession())
+        await tasks()
+        # The call /members/confirm makes once the user confirms
+        return await service.verify_join_transaction(TX_HASH, GROUP, WALLET)
+
+    result = asyncio.run(scenario())
+    assert result["success"]
+    assert rpc_verifications == [TX_HASH]
@@ -17,6 +17,11 @@ Handles all time-based contribution lifecycle tasks:
      - Runs at the END of every period
      - Calls on-chain processRotationPayout() for every active group
 
+  4. snapshot_verified_contracts()
+     - Runs every VERIFIED_SNAPSHOT_SECONDS
+     - Mirrors the factory's group set into verified_contracts so the group
+       listing can check verification in SQL instead of calling the chain
+
 Registered in main.py via lifespan events — see main_lifespan_snippet.py.
 
 Install:
@@ -29,11 +34,14 @@ from typing import Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from database import SessionLocal
-from models import Contribution, ContributionStatus, Group, GroupMember, GroupStatus
+from database import AsyncSessionLocal, SessionLocal
+from models import Contribution, ContributionStatus, Group, GroupMember, GroupStatus, VerifiedContract
 from web3_files.initialize import contribution_contract_svc
+from web3_files.web3_service import Web3JoinFunctions
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +49,11 @@ logger = logging.getLogger(__name__)
 # Kept at 60s — actual chain calls only happen when a period boundary is due.
 POLL_INTERVAL_SECONDS = 60
 
+# How stale the verified_contracts snapshot may get.
+VERIFIED_SNAPSHOT_SECONDS = 10
+
+join_svc = Web3JoinFunctions()
+
 
 # ── DB helpers ─────────────────────────────────────────────────────────────────
 
@@ -314,6 +327,34 @@ def process_rotation_payouts() -> None:
         db.close()
 
 
+# ── task 4: snapshot the on-chain group set ───────────────────────────────────
+
+async def snapshot_verified_contracts() -> None:
+    """
+    Replace the contents of verified_contracts with the factory's current
+    group set. An empty set is indistinguishable from a failed RPC, so in
+    that case the previous snapshot is kept.
+    """
+    addresses = await join_svc.get_blockchain_groups()
+    if not addresses:
+        return
+
+    async with AsyncSessionLocal() as db:
+        try:
+            await db.execute(
+                pg_insert(VerifiedContract)
+                .values([{"address": address} for address in addresses])
+                .on_conflict_do_nothing(index_elements=["address"])
+            )
+            await db.execute(
+                delete(VerifiedContract).where(VerifiedContract.address.not_in(addresses))
+            )
+            await db.commit()
+        except Exception as exc:
+            await db.rollback()
+            logger.error("snapshot_verified_contracts failed: %s", exc)
+
+
 # ── scheduler factory ─────────────────────────────────────────────────────────
 
 def build_scheduler() -> AsyncIOScheduler:
@@ -357,4 +398,14 @@ def build_scheduler() -> AsyncIOScheduler:
         misfire_grace_time=30,
     )
 
+    scheduler.add_job(
+        snapshot_verified_contracts,
+        trigger=IntervalTrigger(seconds=VERIFIED_SNAPSHOT_SECONDS),
+        id="snapshot_verified_contracts",
+        name="Snapshot on-chain group set into verified_contracts",
+        replace_existing=True,
+        max_instances=1,
+        misfire_grace_time=VERIFIED_SNAPSHOT_SECONDS,
+    )
+
     return scheduler
\ No newline at end of file
@@ -21,10 +21,7 @@ class ContributionContractService:
 
     def _get_group_contract(self, group_contract_address: str):
         """Return a bound ChamaGroup contract instance."""
-        return self.web3.w3.eth.contract(
-            address=Web3.to_checksum_address(group_contract_address),
-            abi=self.web3.group_abi,
-        )
+        return self.web3.group_contract(group_contract_address)
 
     def _build_unsigned_tx(self, fn, caller_wallet: str, value_wei: int = 0) -> dict:
         """
@@ -45,7 +42,7 @@ class ContributionContractService:
                 "data": tx["data"],
                 "value": hex(tx.get("value", 0)),
                 "gas": hex(tx.get("gas", self.web3.default_gas_limit)),
-                "chainId": self.web3.w3.eth.chain_id,
+                "chainId": self.web3.chain_id,
             }
         except ContractLogicError as exc:
             raise HTTPException(status_code=400, detail=self.web3._parse_web3_error(exc)) from exc
@@ -60,23 +57,26 @@ class ContributionContractService:
                 detail="Backend wallet not configured — set ADMIN_PRIVATE_KEY in env.",
             )
         try:
-            nonce = self.web3.w3.eth.get_transaction_count(self.web3.admin_account.address)
-            gas_price = self.web3.w3.to_wei(self.web3.default_gas_price, "gwei")
-
-            tx = fn.build_transaction(
-                {
-                    "from": self.web3.admin_account.address,
-                    "nonce": nonce,
-                    "gas": self.web3.default_gas_limit,
-                    "gasPrice": gas_price,
-                    "value": value_wei,
-                }
-            )
+            nonce = self.web3.next_nonce()
+            try:
+                tx = fn.build_transaction(
+                    {
+                        "from": self.web3.admin_account.address,
+                        "nonce": nonce,
+                        "gas": self.web3.default_gas_limit,
+                        "value": value_wei,
+                        **self.web3.fee_params(),
+                    }
+                )
 
-            signed = self.web3.w3.eth.account.sign_transaction(
-                tx, private_key=self.web3.private_key
-            )
-            tx_hash = self.web3.w3.eth.send_raw_transaction(signed.rawTransaction)
+                signed = self.web3.w3.eth.account.sign_transaction(
+                    tx, private_key=self.web3.private_key
+                )
+                tx_hash = self.web3.w3.eth.send_raw_transaction(signed.rawTransaction)
+            except Exception:
+                # The nonce never reached the chain; resync before the next send
+                self.web3.reset_nonce()
+                raise
             receipt = self.web3.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
 
             if receipt.status == 0:
@@ -1,17 +1,26 @@
 import os
-import json
+import functools
+import aiohttp
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from web3 import Web3
-from web3.middleware import geth_poa_middleware
+from web3 import AsyncHTTPProvider, AsyncWeb3, HTTPProvider, Web3
+from web3.middleware import async_geth_poa_middleware, geth_poa_middleware
 from web3.exceptions import ContractLogicError, TransactionNotFound
 from web3.types import TxParams, Wei
 from hexbytes import HexBytes
 from eth_account import Account
-from eth_utils import is_address, to_checksum_address
+from eth_utils import event_abi_to_log_topic, is_address, to_checksum_address, to_hex
+from eth_utils.abi import collapse_if_tuple, function_abi_to_4byte_selector
 import logging
 import asyncio
 import re
+import threading
+import time
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -19,11 +28,91 @@ class Web3ServiceError(Exception):
     """Raised for Web3/blockchain operation failures."""
     pass
 
+
+@functools.lru_cache(maxsize=None)
+def _load_abi(abi_file_path: str) -> List[Dict[str, Any]]:
+    """Parse a Hardhat artifact once per path; every Web3Service shares the result.
+
+    Prefers the ABI-only sidecar (Foo.abi.json) written at image build, which
+    skips the bytecode and metadata that make up most of the artifact, as
+    long as it is not older than the artifact itself.
+    """
+    artifact = Path(abi_file_path)
+    sidecar = artifact.with_suffix('.abi.json')
+    if sidecar.exists() and sidecar.stat().st_mtime >= artifact.stat().st_mtime:
+        abi = orjson.loads(sidecar.read_bytes())
+        logger.info(f"Loaded ABI from {sidecar}")
+        return abi
+    contract_artifact = orjson.loads(artifact.read_bytes())
+    logger.info(f"Loaded ABI from {abi_file_path}")
+    return contract_artifact['abi']
+
+def _orjson_default(obj):
+    """Same fallbacks as web3's Web3JsonEncoder: bytes as 0x-hex, AttributeDicts as dicts"""
+    if isinstance(obj, (bytes, bytearray)):
+        return to_hex(obj)
+    if hasattr(obj, 'keys'):
+        return dict(obj)
+    raise TypeError
+
+
+class _OrjsonRPCMixin:
+    """JSON-RPC bodies encoded and decoded with orjson.
+
+    Falls back to web3's stdlib-json path for anything orjson rejects
+    (integers beyond 64 bits).
+    """
+
+    def encode_rpc_request(self, method, params) -> bytes:
+        try:
+            return orjson.dumps({
+                'jsonrpc': '2.0',
+                'method': method,
+                'params': params or [],
+                'id': next(self.request_counter),
+            }, default=_orjson_default)
+        except TypeError:
+            return super().encode_rpc_request(method, params)
+
+    def decode_rpc_response(self, raw_response: bytes):
+        try:
+            return orjson.loads(raw_response)
+        except orjson.JSONDecodeError:
+            return super().decode_rpc_response(raw_response)
+
+
+class _OrjsonHTTPProvider(_OrjsonRPCMixin, HTTPProvider):
+    pass
+
+
+class _OrjsonAsyncHTTPProvider(_OrjsonRPCMixin, AsyncHTTPProvider):
+    pass
+
+
+def _rpc_session() -> requests.Session:
+    """Keep-alive session for the sync provider, sized for the scheduler and
+    to_thread callers rather than requests' default pool of 10; connect
+    failures are retried with a short backoff"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32, pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class Web3Service:
+    # EIP-1559 fees barely move within a block; reuse them for about one block
+    FEE_CACHE_TTL = float(os.getenv('FEE_CACHE_TTL', '12'))
+
     def __init__(self):
         
         self.provider_url = os.getenv('FUJI_RPC', 'http://127.0.0.1:8545')
-        self.w3 = Web3(Web3.HTTPProvider(self.provider_url))
+        # Optional websocket endpoint; receipt waits subscribe to newHeads on it
+        self.ws_provider_url = os.getenv('FUJI_WS_RPC')
+        self.w3 = Web3(_OrjsonHTTPProvider(self.provider_url, session=_rpc_session()))
         
         
         self.w3.middleware_onion.inject(geth_poa_middleware, layer=0)
@@ -34,12 +123,50 @@ class Web3Service:
         # Load contract ABI - no fallback, let it throw error if missing
         self.factory_abi = self._load_contract_abi()
         self.group_abi = self._load_group_contract_abi()
+
+        # topic0 of the factory's GroupCreated event, for picking its logs out
+        # of a receipt without ABI-decoding every log
+        self.group_created_topic = HexBytes(event_abi_to_log_topic(next(
+            item for item in self.factory_abi
+            if item.get('type') == 'event' and item.get('name') == 'GroupCreated'
+        )))
+
+        # createGroup selector and input types, so preparing a creation only
+        # ABI-encodes the config instead of resolving the function each call
+        create_group_abi = next(
+            item for item in self.factory_abi
+            if item.get('type') == 'function' and item.get('name') == 'createGroup'
+        )
+        self.create_group_selector = function_abi_to_4byte_selector(create_group_abi)
+        self.create_group_input_types = [collapse_if_tuple(i) for i in create_group_abi['inputs']]
+
+        # joinGroup() and contribute() take no arguments, so their calldata is
+        # just the selector; the prepare_* routes reuse it as-is
+        self.join_group_data, self.contribute_data = (
+            to_hex(function_abi_to_4byte_selector(next(
+                item for item in self.group_abi
+                if item.get('type') == 'function' and item.get('name') == name
+            )))
+            for name in ('joinGroup', 'contribute')
+        )
         
         # Initialize contract instance
         self.factory_contract = self.w3.eth.contract(
             address=to_checksum_address(self.factory_address),
             abi=self.factory_abi
         )
+
+        # Async client on the same node for reads on the request path; the
+        # sync client above stays for signing, the scheduler and the
+        # contribution service
+        self.async_w3 = AsyncWeb3(_OrjsonAsyncHTTPProvider(
+            self.provider_url, request_kwargs={"timeout": 30}
+        ))
+        self.async_w3.middleware_onion.inject(async_geth_poa_middleware, layer=0)
+        self.async_factory_contract = self.async_w3.eth.contract(
+            address=to_checksum_address(self.factory_address),
+            abi=self.factory_abi
+        )
         
         # Optional: Load private key only for admin operations
         self._initialize_admin_account()
@@ -47,9 +174,24 @@ class Web3Service:
         # Gas configuration
         self.default_gas_limit = int(os.getenv('DEFAULT_GAS_LIMIT', '2000000'))
         self.default_gas_price = os.getenv('DEFAULT_GAS_PRICE', '20')  # gwei
+
+        # Admin-account nonces are handed out locally so concurrent sends
+        # don't race on eth_getTransactionCount; (expiry, fee fields) for fee_params
+        self._nonce_lock = threading.Lock()
+        self._nonce: Optional[int] = None
+        self._fees: tuple = (0.0, None)
+        # eth_chainId never changes for a given endpoint; fetched on first use
+        self._chain_id: Optional[int] = None
+
+        # Bound ChamaGroup contracts per checksummed address. Building one
+        # walks the whole ABI, and the same few groups are hit on every request
+        self._group_contracts: Dict[str, Any] = {}
+        self._async_group_contracts: Dict[str, Any] = {}
         
-        # Verify connection on initialization
-        self._verify_connection()
+        # Connection is checked by ready() from the app lifespan rather than
+        # here, so importing the service doesn't block on the node
+        self._verified = False
+        self._ready_lock = asyncio.Lock()
 
   
 
@@ -61,6 +203,73 @@ class Web3Service:
             return False
 
 
+    @property
+    def chain_id(self) -> int:
+        if self._chain_id is None:
+            self._chain_id = self.w3.eth.chain_id
+        return self._chain_id
+
+    async def chain_id_async(self) -> int:
+        if self._chain_id is None:
+            self._chain_id = await self.async_w3.eth.chain_id
+        return self._chain_id
+
+    async def open_async_session(self):
+        """Give the async provider one long-lived, keep-alive aiohttp session.
+
+        Called from the app lifespan so every awaited RPC reuses pooled
+        connections instead of the provider's lazily built default session.
+        """
+        self._async_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=50, ttl_dns_cache=300, keepalive_timeout=60
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        await self.async_w3.provider.cache_async_session(self._async_session)
+
+    async def close_async_session(self):
+        session = getattr(self, '_async_session', None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def is_connected_async(self) -> bool:
+        """is_connected off the event loop, for async callers"""
+        return await asyncio.to_thread(self.is_connected)
+
+    def next_nonce(self) -> int:
+        """Next nonce for the admin account; only the first call after a reset asks the node"""
+        with self._nonce_lock:
+            if self._nonce is None:
+                self._nonce = self.w3.eth.get_transaction_count(self.admin_account.address, 'pending')
+            nonce = self._nonce
+            self._nonce += 1
+            return nonce
+
+    def reset_nonce(self):
+        """Drop the local counter after a failed send so the next call resyncs from the node"""
+        with self._nonce_lock:
+            self._nonce = None
+
+    def fee_params(self) -> Dict[str, int]:
+        """EIP-1559 fee fields from eth_feeHistory, falling back to legacy gasPrice"""
+        expiry, fees = self._fees
+        if fees is not None and time.monotonic() < expiry:
+            return fees
+        try:
+            history = self.w3.eth.fee_history(10, 'latest', [50])
+            # Last entry is the base fee of the next block
+            base_fee = history['baseFeePerGas'][-1]
+            tips = sorted(reward[0] for reward in history['reward'] if reward)
+            tip = tips[len(tips) // 2] if tips else self.w3.to_wei(1, 'gwei')
+            # 2x base fee covers several full blocks of base fee growth
+            fees = {'maxFeePerGas': 2 * base_fee + tip, 'maxPriorityFeePerGas': tip}
+        except Exception as e:
+            logger.warning(f"fee_history unavailable, using legacy gas price: {e}")
+            fees = {'gasPrice': self.w3.to_wei(self.default_gas_price, 'gwei')}
+        self._fees = (time.monotonic() + self.FEE_CACHE_TTL, fees)
+        return fees
+
     def _parse_web3_error(self, error: Exception) -> str:
         """Extract human-readable message from Web3/RPC errors"""
         err_str = str(error)
@@ -111,29 +320,45 @@ class Web3Service:
             logger.info("No admin private key provided - admin operations will be disabled")
 
         
-    def _verify_connection(self):
-        if not self.is_connected():
-            raise Web3ServiceError(f"Failed to connect to Web3 provider: {self.provider_url}")
-        logger.info(f"Successfully connected to Web3 provider: {self.provider_url}")
-        # Remove the get_group_counter() call — it doesn't exist on this service
+    async def ready(self):
+        """Check the provider once; concurrent first callers share the check"""
+        if self._verified:
+            return
+        async with self._ready_lock:
+            if self._verified:
+                return
+            if not await self.async_w3.is_connected():
+                raise Web3ServiceError(f"Failed to connect to Web3 provider: {self.provider_url}")
+            self._verified = True
+            logger.info(f"Successfully connected to Web3 provider: {self.provider_url}")
 
         
+    def group_contract(self, group_address: str):
+        """Cached ChamaGroup contract on the sync client"""
+        address = to_checksum_address(group_address)
+        contract = self._group_contracts.get(address)
+        if contract is None:
+            contract = self._group_contracts[address] = self.w3.eth.contract(
+                address=address, abi=self.group_abi
+            )
+        return contract
+
+    def async_group_contract(self, group_address: str):
+        """Cached ChamaGroup contract on the async client"""
+        address = to_checksum_address(group_address)
+        contract = self._async_group_contracts.get(address)
+        if contract is None:
+            contract = self._async_group_contracts[address] = self.async_w3.eth.contract(
+                address=address, abi=self.group_abi
+            )
+        return contract
+
     def _load_contract_abi(self) -> List[Dict[str, Any]]:
         """Load factory contract ABI from artifacts - throw error if missing"""
-        abi_file_path = os.getenv('CONTRACT_ABI_PATH', './artifacts/contracts/ChamaFactory.sol/ChamaFactory.json')
-        
-        with open(abi_file_path, 'r') as f:
-            contract_artifact = json.load(f)
-            logger.info(f"Loaded Factory ABI from {abi_file_path}")
-            return contract_artifact['abi']
+        return _load_abi(os.getenv('CONTRACT_ABI_PATH', './artifacts/contracts/ChamaFactory.sol/ChamaFactory.json'))
     
     def _load_group_contract_abi(self) -> List[Dict[str, Any]]:
         """Load group contract ABI from artifacts"""
-        abi_file_path = os.getenv('GROUP_ABI_PATH', './artifacts/contracts/ChamaGroup.sol/ChamaGroup.json')
-        
-        with open(abi_file_path, 'r') as f:
-            contract_artifact = json.load(f)
-            logger.info(f"Loaded Group ABI from {abi_file_path}")
-            return contract_artifact['abi']
+        return _load_abi(os.getenv('GROUP_ABI_PATH', './artifacts/contracts/ChamaGroup.sol/ChamaGroup.json'))
 
 
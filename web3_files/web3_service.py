@@ -1,49 +1,289 @@
 import os
 import json
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from web3 import Web3
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+from web3 import AsyncWeb3, Web3, WebsocketProviderV2
 from web3.middleware import geth_poa_middleware
-from web3.exceptions import ContractLogicError, TransactionNotFound
+from web3.exceptions import ContractLogicError, TransactionNotFound, TimeExhausted
 from web3.types import TxParams, Wei
 from hexbytes import HexBytes
 from eth_account import Account
 from eth_utils import is_address, to_checksum_address
 import logging
 import asyncio
-from schemas import GroupCreate
+import functools
+import hashlib
+import time
+import orjson
+from web3._utils.request import async_make_post_request
+from schemas import ETH_ADDRESS_RE, GroupCreate
 from .initialize import web3_service
 
 # Configure loggingCreate
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=4096)
+def _norm_address(address: str) -> str:
+    """Lowercased address; the factory hands back the same checksummed strings every refresh"""
+    return address.lower()
+
+
+# Multicall3 sits at the same address on Fuji, mainnet and most EVM chains
+MULTICALL3_ADDRESS = os.getenv('MULTICALL3_ADDRESS', '0xcA11bde05977b3631167028862bE2a173976CA11')
+_MULTICALL3_ABI = [{
+    'name': 'aggregate3',
+    'type': 'function',
+    'stateMutability': 'payable',
+    'inputs': [{'name': 'calls', 'type': 'tuple[]', 'components': [
+        {'name': 'target', 'type': 'address'},
+        {'name': 'allowFailure', 'type': 'bool'},
+        {'name': 'callData', 'type': 'bytes'},
+    ]}],
+    'outputs': [{'name': 'returnData', 'type': 'tuple[]', 'components': [
+        {'name': 'success', 'type': 'bool'},
+        {'name': 'returnData', 'type': 'bytes'},
+    ]}],
+}, {
+    'name': 'getEthBalance',
+    'type': 'function',
+    'stateMutability': 'view',
+    'inputs': [{'name': 'addr', 'type': 'address'}],
+    'outputs': [{'name': 'balance', 'type': 'uint256'}],
+}]
+
+# ChamaGroup views read by diagnose_join_failure: (function, output types, takes the user address)
+_JOIN_DIAGNOSTIC_CALLS = (
+    ('getMemberDetails', ['bool', 'bool', 'uint256', 'uint256', 'uint256', 'uint256'], True),
+    ('memberCount', ['uint256'], False),
+    ('isActive', ['bool'], False),
+    ('rules', ['string', 'uint256', 'string', 'uint256', 'uint256', 'uint256', 'uint8', 'bool', 'bool'], False),
+)
+
 class Web3JoinFunctions():
     w3 = web3_service.w3
     group_abi = web3_service.group_abi
     default_gas_limit = web3_service.default_gas_limit
     factory_contract = web3_service.factory_contract
     factory_address= web3_service.factory_address
+    group_created_topic = web3_service.group_created_topic
+    create_group_selector = web3_service.create_group_selector
+    create_group_input_types = web3_service.create_group_input_types
+    join_group_data = web3_service.join_group_data
+    contribute_data = web3_service.contribute_data
+    provider_url = web3_service.provider_url
+    ws_provider_url = web3_service.ws_provider_url
+    default_gas_price = web3_service.default_gas_price
+    admin_account = web3_service.admin_account
+    private_key = web3_service.private_key
+    async_w3 = web3_service.async_w3
+    async_factory_contract = web3_service.async_factory_contract
+
+    # In-flight receipt lookups keyed by tx hash — concurrent verify_* calls
+    # for the same transaction share one RPC instead of each polling the node
+    _inflight: Dict[str, asyncio.Future] = {}
+
+    # getAllGroups() only changes when a block lands, so keep the result for
+    # about one block time — (expiry, frozenset of lowercased addresses)
+    BLOCKCHAIN_GROUPS_TTL = float(os.getenv('BLOCKCHAIN_GROUPS_TTL', '10'))
+    _groups_cache: tuple = (0.0, None)
+
+    # Seconds between receipt polls while waiting for a transaction to mine
+    TX_POLL_LATENCY = float(os.getenv('TX_POLL_LATENCY', '1.0'))
+
+    # Upper bound on calls per JSON-RPC batch; some providers reject or
+    # throttle large batches
+    RPC_BATCH_SIZE = int(os.getenv('RPC_BATCH_SIZE', '20'))
+
+    # eth_gasPrice is chain-global and barely moves between blocks; prepared
+    # transactions reuse it for a few seconds — (expiry, buffered wei)
+    GAS_PRICE_TTL = float(os.getenv('GAS_PRICE_TTL', '3'))
+    _gas_price_cache: tuple = (0.0, None)
+
+    # Buffered eth_estimateGas results keyed by a digest of (to, data, from,
+    # value) — re-preparing the same call skips the EVM simulation. Cleared
+    # whenever a user transaction verifies, since that may move contract state
+    GAS_ESTIMATE_TTL = float(os.getenv('GAS_ESTIMATE_TTL', '30'))
+    GAS_ESTIMATE_CACHE_SIZE = 1024
+    _gas_estimates: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+    # Cap on concurrent per-group isValidGroup calls in batch_verify_groups
+    VERIFY_CONCURRENCY = int(os.getenv('VERIFY_CONCURRENCY', '32'))
+
+    # Successful join verifications keyed by (tx_hash, group, user). A mined
+    # receipt doesn't change, so retried confirms can skip the RPCs —
+    # (expiry, result), oldest evicted first
+    VERIFIED_TX_TTL = float(os.getenv('VERIFIED_TX_TTL', '86400'))
+    VERIFIED_TX_CACHE_SIZE = 4096
+    _verified_joins: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+    # How long a submit-join background task waits for the tx to mine before
+    # giving up on pre-warming the verification cache
+    JOIN_PREWARM_TIMEOUT = float(os.getenv('JOIN_PREWARM_TIMEOUT', '120'))
+
+    def _single_flight(self, key: str, fn) -> asyncio.Future:
+        """Run fn once per key; concurrent callers await the same result.
+
+        Coroutine functions are scheduled on the loop, anything else is
+        treated as blocking and run in the executor.
+        """
+        fut = self._inflight.get(key)
+        if fut is None:
+            if asyncio.iscoroutinefunction(fn):
+                fut = asyncio.ensure_future(fn())
+            else:
+                fut = asyncio.get_running_loop().run_in_executor(None, fn)
+            self._inflight[key] = fut
+            fut.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield so one cancelled caller doesn't cancel the shared lookup
+        return asyncio.shield(fut)
+
+    async def rpc_batch(self, calls: List[tuple]) -> List[Any]:
+        """Send [(method, params), ...] as JSON-RPC batches; results come back in call order.
+
+        Posted through the async provider's request path, so batches share the
+        keep-alive aiohttp session opened in the app lifespan (and closed there).
+        """
+        request_kwargs = self.async_w3.provider.get_request_kwargs()
+        results = []
+        for start in range(0, len(calls), self.RPC_BATCH_SIZE):
+            chunk = calls[start:start + self.RPC_BATCH_SIZE]
+            raw = await async_make_post_request(self.provider_url, orjson.dumps([
+                {'jsonrpc': '2.0', 'id': i, 'method': method, 'params': params}
+                for i, (method, params) in enumerate(chunk)
+            ]), **request_kwargs)
+            replies = orjson.loads(raw)
+            if not isinstance(replies, list):
+                # Providers without batch support answer with a single error object
+                raise ValueError(f"RPC batch rejected: {replies}")
+
+            by_id = {reply.get('id'): reply for reply in replies}
+            for i, (method, _) in enumerate(chunk):
+                reply = by_id.get(i)
+                if reply is None or 'error' in reply:
+                    raise ValueError(f"RPC batch call {method} failed: {reply.get('error') if reply else 'no reply'}")
+                results.append(reply['result'])
+        return results
+
+    async def _await_receipt(self, tx_hash, timeout: float = 120):
+        """Wait for a receipt without tying up a thread.
+
+        With FUJI_WS_RPC set, the receipt is checked once per new block from
+        a newHeads subscription; otherwise (or if the socket fails) it is
+        polled every TX_POLL_LATENCY seconds. Raises TimeExhausted like web3's
+        wait_for_transaction_receipt.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        if self.ws_provider_url:
+            try:
+                return await asyncio.wait_for(self._receipt_on_new_heads(tx_hash), timeout)
+            except asyncio.TimeoutError:
+                raise TimeExhausted(f"Transaction {tx_hash!r} is not in the chain after {timeout} seconds")
+            except Exception as e:
+                logger.warning(f"newHeads subscription unavailable, polling for receipt: {e}")
+        while True:
+            try:
+                return await self.async_w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                pass
+            if loop.time() >= deadline:
+                raise TimeExhausted(f"Transaction {tx_hash!r} is not in the chain after {timeout} seconds")
+            await asyncio.sleep(self.TX_POLL_LATENCY)
+
+    async def _receipt_on_new_heads(self, tx_hash):
+        """Look the receipt up each time a block arrives on the websocket"""
+        async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(self.ws_provider_url)) as ws_w3:
+            await ws_w3.eth.subscribe('newHeads')
+            # Covers a transaction that mined before the subscription went live
+            try:
+                return await self.async_w3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                pass
+            async for _ in ws_w3.ws.process_subscriptions():
+                try:
+                    return await self.async_w3.eth.get_transaction_receipt(tx_hash)
+                except TransactionNotFound:
+                    continue
+        raise ConnectionError("newHeads subscription closed")
+
+    def _cached_gas_price(self) -> Optional[int]:
+        """Buffered gas price if still within GAS_PRICE_TTL"""
+        expiry, cached = Web3JoinFunctions._gas_price_cache
+        if cached is not None and time.monotonic() < expiry:
+            return cached
+        return None
+
+    def _store_gas_price(self, network_gas_price: int) -> int:
+        # Add 10% buffer
+        gas_price = int(network_gas_price * 1.1)
+        Web3JoinFunctions._gas_price_cache = (time.monotonic() + self.GAS_PRICE_TTL, gas_price)
+        return gas_price
+
     def _get_gas_price(self) -> int:
-        """Get current gas price with fallback"""
+        """Get current gas price with fallback (cached for GAS_PRICE_TTL seconds)"""
+        cached = self._cached_gas_price()
+        if cached is not None:
+            return cached
         try:
             # Try to get current gas price from network
-            network_gas_price = self.w3.eth.gas_price
-            # Add 10% buffer
-            return int(network_gas_price * 1.1)
+            return self._store_gas_price(self.w3.eth.gas_price)
+        except Exception as e:
+            logger.warning(f"Could not fetch network gas price: {e}, using default")
+            return self.w3.to_wei(self.default_gas_price, 'gwei')
+
+    async def _get_gas_price_async(self) -> int:
+        """_get_gas_price on the async client"""
+        cached = self._cached_gas_price()
+        if cached is not None:
+            return cached
+        try:
+            return self._store_gas_price(await self.async_w3.eth.gas_price)
         except Exception as e:
             logger.warning(f"Could not fetch network gas price: {e}, using default")
             return self.w3.to_wei(self.default_gas_price, 'gwei')
+
+    @staticmethod
+    def _tx_for_estimation(transaction_data: dict, from_address: str) -> dict:
+        return {
+            'from': to_checksum_address(from_address),
+            'to': transaction_data.get('to'),
+            'data': transaction_data.get('data'),
+            'value': transaction_data.get('value', 0)
+        }
+
+    @staticmethod
+    def _gas_estimate_key(tx_for_estimation: dict) -> bytes:
+        return hashlib.blake2b(
+            f"{tx_for_estimation['to']}|{tx_for_estimation['data']}|"
+            f"{tx_for_estimation['from']}|{tx_for_estimation['value']}".lower().encode(),
+            digest_size=16
+        ).digest()
+
+    def _cached_gas_estimate(self, key: bytes) -> Optional[int]:
+        cached = self._gas_estimates.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+        return None
+
+    def _store_gas_estimate(self, key: bytes, estimated_gas: int) -> int:
+        """Add 20% headroom to a raw estimate and cache it"""
+        gas = int(estimated_gas * 1.2)
+        self._gas_estimates[key] = (time.monotonic() + self.GAS_ESTIMATE_TTL, gas)
+        if len(self._gas_estimates) > self.GAS_ESTIMATE_CACHE_SIZE:
+            self._gas_estimates.popitem(last=False)
+        return gas
     
     def _estimate_gas_for_user(self, transaction_data: dict, from_address: str) -> int:
         try:
-            tx_for_estimation = {
-                'from': to_checksum_address(from_address),
-                'to': transaction_data.get('to'),
-                'data': transaction_data.get('data'),
-                'value': transaction_data.get('value', 0)
-            }
-            
+            tx_for_estimation = self._tx_for_estimation(transaction_data, from_address)
+            key = self._gas_estimate_key(tx_for_estimation)
+            cached = self._cached_gas_estimate(key)
+            if cached is not None:
+                return cached
+
             estimated_gas = self.w3.eth.estimate_gas(tx_for_estimation)
             logger.info(f" Gas estimated successfully: {estimated_gas}")
 
@@ -56,20 +296,102 @@ class Web3JoinFunctions():
                 except Exception as call_err:
                     logger.error(f" eth_call revert reason: {call_err}")
 
-            return int(estimated_gas * 1.2)
+            return self._store_gas_estimate(key, estimated_gas)
+        except Exception as e:
+            logger.warning(f"Gas estimation failed: {e}, using default")
+            return self.default_gas_limit
+
+    async def _estimate_gas_for_user_async(self, transaction_data: dict, from_address: str) -> int:
+        """_estimate_gas_for_user on the async client"""
+        try:
+            tx_for_estimation = self._tx_for_estimation(transaction_data, from_address)
+            key = self._gas_estimate_key(tx_for_estimation)
+            cached = self._cached_gas_estimate(key)
+            if cached is not None:
+                return cached
+
+            estimated_gas = await self.async_w3.eth.estimate_gas(tx_for_estimation)
+            logger.info(f" Gas estimated successfully: {estimated_gas}")
+            if estimated_gas > 500000:
+                logger.warning(f"⚠️ Suspiciously high gas estimate: {estimated_gas}")
+                try:
+                    await self.async_w3.eth.call(tx_for_estimation)
+                    logger.info("eth_call succeeded — no revert")
+                except Exception as call_err:
+                    logger.error(f" eth_call revert reason: {call_err}")
+
+            return self._store_gas_estimate(key, estimated_gas)
         except Exception as e:
             logger.warning(f"Gas estimation failed: {e}, using default")
             return self.default_gas_limit
 
+    async def _latest_base_fee(self) -> Optional[int]:
+        try:
+            return (await self.async_w3.eth.get_block('latest')).get('baseFeePerGas')
+        except Exception as e:
+            logger.warning(f"Could not fetch latest block: {e}")
+            return None
+
+    async def _prepare_tx_context(self, from_address: str, transaction_data: dict, eip1559: bool = False) -> Dict[str, Any]:
+        """Pending nonce, fee input and gas estimate for a prepare_* route.
+
+        The fee input is the buffered gas price or, with eip1559, the latest
+        block's base fee (None if unavailable). Gas price and estimate come
+        from their caches when fresh; whatever is left goes out as one
+        JSON-RPC batch. If the provider rejects the batch or any call errors
+        (an estimate that reverts), the same reads are awaited concurrently
+        with their usual defaults.
+        """
+        tx_for_estimation = self._tx_for_estimation(transaction_data, from_address)
+        estimate_key = self._gas_estimate_key(tx_for_estimation)
+        gas = self._cached_gas_estimate(estimate_key)
+        gas_price = None if eip1559 else self._cached_gas_price()
+
+        calls = [('eth_getTransactionCount', [from_address, 'pending'])]
+        if eip1559:
+            calls.append(('eth_getBlockByNumber', ['latest', False]))
+        elif gas_price is None:
+            calls.append(('eth_gasPrice', []))
+        if gas is None:
+            calls.append(('eth_estimateGas', [{**tx_for_estimation, 'value': hex(tx_for_estimation['value'])}]))
+
+        try:
+            replies = iter(await self.rpc_batch(calls))
+        except Exception as e:
+            logger.warning(f"RPC batch unavailable, falling back to separate calls: {e}")
+            nonce, fee, gas = await asyncio.gather(
+                self.async_w3.eth.get_transaction_count(from_address, 'pending'),
+                self._latest_base_fee() if eip1559 else self._get_gas_price_async(),
+                self._estimate_gas_for_user_async(transaction_data, from_address),
+            )
+            return {'nonce': nonce, 'gas': gas, ('base_fee' if eip1559 else 'gas_price'): fee}
+
+        context = {'nonce': int(next(replies), 16)}
+        if eip1559:
+            base_fee = (next(replies) or {}).get('baseFeePerGas')
+            context['base_fee'] = int(base_fee, 16) if base_fee else None
+        else:
+            context['gas_price'] = gas_price if gas_price is not None else self._store_gas_price(int(next(replies), 16))
+        context['gas'] = gas if gas is not None else self._store_gas_estimate(estimate_key, int(next(replies), 16))
+        return context
+
     def _get_group_contract(self, group_address: str):
         """Get group contract instance"""
         if not self.validate_address(group_address):
             raise ValueError("Invalid group address")
         
-        return self.w3.eth.contract(
-            address=to_checksum_address(group_address),
-            abi=self.group_abi
-        )
+        return web3_service.group_contract(group_address)
+
+    def _get_async_group_contract(self, group_address: str):
+        """Group contract bound to the async client, for awaited reads"""
+        if not self.validate_address(group_address):
+            raise ValueError("Invalid group address")
+
+        return web3_service.async_group_contract(group_address)
+
+    async def _fetch_receipt(self, tx_hash):
+        """Single receipt lookup on the async client (raises TransactionNotFound while pending)"""
+        return await self.async_w3.eth.get_transaction_receipt(tx_hash)
 
 
     async def prepare_group_creation_transaction(self, group_data: GroupCreate, creator_address: str) -> Dict[str, Any]:
@@ -92,29 +414,37 @@ class Web3JoinFunctions():
                     or getattr(group_data, 'contribution_cycle', None) 
                     or "weekly",
                     0,
-                    getattr(group_data, 'approval_required', False),
+                    bool(getattr(group_data, 'approval_required', False)),
                     False,
                     creator_checksum,
                     '0x0000000000000000000000000000000000000000',
                     86400,
                     172800
                 )
+            logger.info(f"Config tuple: {config}")
+
+            #  Every other field is fixed, so only the calldata is encoded here;
+            # the EIP-1559 (type 2) payload is assembled below
+            transaction_data = {
+                'to': self.factory_contract.address,
+                'data': HexBytes(
+                    self.create_group_selector
+                    + self.w3.codec.encode(self.create_group_input_types, [config])
+                ).hex(),
+                'value': 0,
+            }
+
             #  Let frontend provide the nonce — it knows the actual account
             # Backend nonce is unreliable if frontend account differs from what we query
-            nonce = self.w3.eth.get_transaction_count(creator_checksum)
+            context = await self._prepare_tx_context(creator_checksum, transaction_data, eip1559=True)
+            nonce = context['nonce']
             logger.info(f"Nonce for {creator_checksum}: {nonce}")
-            logger.info(f"Config tuple: {config}")
 
             #  EIP-1559 fee calculation with safe fallback
             FUJI_MIN_BASE_FEE = self.w3.to_wei(25, 'gwei')  # Avalanche Fuji minimum
-            try:
-                latest_block = self.w3.eth.get_block('latest')
-                base_fee = latest_block.get('baseFeePerGas') or FUJI_MIN_BASE_FEE
-                if base_fee < FUJI_MIN_BASE_FEE:
-                    logger.warning(f"baseFeePerGas {base_fee} below Fuji minimum, using {FUJI_MIN_BASE_FEE}")
-                    base_fee = FUJI_MIN_BASE_FEE
-            except Exception as e:
-                logger.warning(f"Could not fetch latest block: {e}, using minimum base fee")
+            base_fee = context['base_fee'] or FUJI_MIN_BASE_FEE
+            if base_fee < FUJI_MIN_BASE_FEE:
+                logger.warning(f"baseFeePerGas {base_fee} below Fuji minimum, using {FUJI_MIN_BASE_FEE}")
                 base_fee = FUJI_MIN_BASE_FEE
 
             max_priority_fee = self.w3.to_wei(2, 'gwei')
@@ -126,18 +456,7 @@ class Web3JoinFunctions():
                 f"priorityFee: {max_priority_fee / 1e9:.2f} Gwei"
             )
 
-            #  Build as EIP-1559 (type 2) — matches what Core Wallet will sign
-            transaction_data = self.factory_contract.functions.createGroup(config).build_transaction({
-                'from': creator_checksum,
-                # 'nonce': nonce,
-                'maxFeePerGas': max_fee,
-                'maxPriorityFeePerGas': max_priority_fee,
-                'gas': self.default_gas_limit,
-                'type': 2,
-                'chainId': 43113,
-            })
-
-            estimated_gas = self._estimate_gas_for_user(transaction_data, creator_checksum)
+            estimated_gas = context['gas']
             estimated_cost_avax = round((max_fee * estimated_gas) / 1e18, 6)
 
             return {
@@ -183,9 +502,7 @@ class Web3JoinFunctions():
 
            
             try:
-                tx = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: self.w3.eth.get_transaction(tx_hash)
-                )
+                tx = await self.async_w3.eth.get_transaction(tx_hash)
                 if tx is None:
                     return {
                         'success': False,
@@ -196,9 +513,9 @@ class Web3JoinFunctions():
 
             # Non-blocking wait
             try:
-                receipt = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+                receipt = await self._single_flight(
+                    f"wait:{tx_hash.lower()}",
+                    functools.partial(self._await_receipt, tx_hash, timeout)
                 )
             except TimeExhausted:
                 return {
@@ -210,15 +527,7 @@ class Web3JoinFunctions():
                 return {'success': False, 'error': 'Transaction reverted on blockchain'}
 
             # Parse GroupCreated event for contract address
-            contract_address = None
-            for log in receipt['logs']:
-                try:
-                    parsed_log = self.factory_contract.events.GroupCreated().process_log(log)
-                    contract_address = parsed_log['args'].get('groupAddress')
-                    break
-                except Exception as log_err:
-                    logger.debug(f"Skipping log: {log_err}")
-                    continue
+            contract_address = self._parse_group_created_event(receipt)
 
             if not contract_address:
                 contract_address = receipt.get('contractAddress')
@@ -251,28 +560,26 @@ class Web3JoinFunctions():
             group_checksum = to_checksum_address(group_address)
             
             # Get group contract instance
-            group_contract = self._get_group_contract(group_address)
+            group_contract = self._get_async_group_contract(group_address)
             
             # Check if group exists and is active
             try:
-                member_count = group_contract.functions.memberCount().call()
+                member_count = await group_contract.functions.memberCount().call()
                 logger.info(f"Current member count: {member_count}")
             except Exception as e:
                 return {'success': False, 'error': 'Group contract not found or invalid'}
             
-            # Get user's nonce
-            nonce = self.w3.eth.get_transaction_count(user_checksum)
-            
-            # Build transaction data
-            transaction_data = group_contract.functions.joinGroup().build_transaction({
-                'from': user_checksum,
-                'nonce': nonce,
-                'gasPrice': self._get_gas_price(),
-                'gas': self.default_gas_limit
-            })
+            # Build transaction data; the calldata is the precomputed selector,
+            # so nothing is ABI-encoded and no eth_chainId lookup is made
+            transaction_data = {
+                'to': group_checksum,
+                'data': self.join_group_data,
+                'value': 0,
+            }
             
-            # Estimate gas
-            estimated_gas = self._estimate_gas_for_user(transaction_data, user_address)
+            # Nonce, gas price and gas estimate in one round trip
+            context = await self._prepare_tx_context(user_checksum, transaction_data)
+            nonce, gas_price, estimated_gas = context['nonce'], context['gas_price'], context['gas']
             
             return {
                 'success': True,
@@ -281,10 +588,10 @@ class Web3JoinFunctions():
                     'from': user_address.lower(),
                     'data': transaction_data['data'],
                     'gas': hex(estimated_gas),
-                    'gasPrice': hex(transaction_data['gasPrice']),
+                    'gasPrice': hex(gas_price),
                     'nonce': hex(nonce),
                     'value': '0x0',
-                    'chainId': self.w3.eth.chain_id
+                    'chainId': await web3_service.chain_id_async()
                 },
                 'message': 'Transaction prepared. Please sign with your wallet.',
                 'estimated_gas': estimated_gas
@@ -306,23 +613,16 @@ class Web3JoinFunctions():
             user_checksum = to_checksum_address(user_address)
             group_checksum = to_checksum_address(group_address)
             
-            # Get group contract instance
-            group_contract = self._get_group_contract(group_address)
-            
-            # Get user's nonce
-            nonce = self.w3.eth.get_transaction_count(user_checksum)
-            
-            # Build transaction data
-            transaction_data = group_contract.functions.contribute().build_transaction({
-                'from': user_checksum,
+            # Build transaction data from the precomputed contribute() selector
+            transaction_data = {
+                'to': group_checksum,
+                'data': self.contribute_data,
                 'value': contribution_amount,
-                'nonce': nonce,
-                'gasPrice': self._get_gas_price(),
-                'gas': self.default_gas_limit
-            })
+            }
             
-            # Estimate gas
-            estimated_gas = self._estimate_gas_for_user(transaction_data, user_address)
+            # Nonce, gas price and gas estimate in one round trip
+            context = await self._prepare_tx_context(user_checksum, transaction_data)
+            nonce, gas_price, estimated_gas = context['nonce'], context['gas_price'], context['gas']
             
             return {
                 'success': True,
@@ -331,10 +631,10 @@ class Web3JoinFunctions():
                     'from': user_address.lower(),
                     'data': transaction_data['data'],
                     'gas': hex(estimated_gas),
-                    'gasPrice': hex(transaction_data['gasPrice']),
+                    'gasPrice': hex(gas_price),
                     'nonce': hex(nonce),
                     'value': hex(contribution_amount),
-                    'chainId': self.w3.eth.chain_id
+                    'chainId': await web3_service.chain_id_async()
                 },
                 'message': 'Transaction prepared. Please sign with your wallet.',
                 'estimated_gas': estimated_gas,
@@ -346,57 +646,11 @@ class Web3JoinFunctions():
             logger.error(f"Contribution preparation failed: {e}")
             return {'success': False, 'error': str(e)}
 
-    async def verify_user_transaction(self, tx_hash: str, expected_from: str, expected_to: str = None) -> Dict[str, Any]:
-        """Verify that a user-submitted transaction was successful"""
-        try:
-            # Convert string to HexBytes for proper type handling
-            if not tx_hash.startswith('0x'):
-                tx_hash = '0x' + tx_hash
-            hash_bytes = HexBytes(tx_hash)
-            
-            # Get transaction receipt
-            receipt = self.w3.eth.wait_for_transaction_receipt(hash_bytes, timeout=300)
-            
-            # Check transaction status
-            if receipt['status'] == 0:
-                return {'success': False, 'error': 'Transaction failed'}
-            
-            # Get transaction details
-            transaction = self.w3.eth.get_transaction(hash_bytes)
-            
-            # Verify the transaction was sent from the expected address
-            if transaction.get('from', '').lower() != expected_from.lower():
-                return {
-                    'success': False, 
-                    'error': f'Transaction was not sent from expected address. Expected: {expected_from}, Got: {transaction.get("from", "")}'
-                }
-            
-            # Verify destination if provided
-            if expected_to and transaction.get('to', '').lower() != expected_to.lower():
-                return {
-                    'success': False,
-                    'error': f'Transaction was not sent to expected contract. Expected: {expected_to}, Got: {transaction.get("to", "")}'
-                }
-                
-            return {
-                'success': True,
-                'tx_hash': tx_hash,
-                'block_number': receipt['blockNumber'],
-                'gas_used': receipt['gasUsed'],
-                'effective_gas_price': receipt.get('effectiveGasPrice'),
-                'from': transaction.get('from', '').lower(),
-                'to': transaction.get('to', '').lower() if transaction.get('to') else None,
-                'value': str(transaction.get('value', 0))
-            }
-            
-        except Exception as e:
-            logger.error(f"Transaction verification failed: {e}")
-            return {'success': False, 'error': str(e)}
-
     async def verify_group_creation_transaction(self, tx_hash: str, creator_address: str) -> Dict[str, Any]:
         """Verify a group creation transaction and extract the group address"""
         try:
-            verification_result = await self.verify_user_transaction(
+            # Reuse the receipt verification already fetched to parse events
+            verification_result, receipt = await self._verify_user_transaction(
                 tx_hash, 
                 creator_address, 
                 self.factory_address
@@ -405,19 +659,16 @@ class Web3JoinFunctions():
             if not verification_result['success']:
                 return verification_result
             
-            # Get transaction receipt to parse events
-            if not tx_hash.startswith('0x'):
-                tx_hash = '0x' + tx_hash
-            hash_bytes = HexBytes(tx_hash)
-            receipt = self.w3.eth.get_transaction_receipt(hash_bytes)
-            
             # Parse events to get group address
             group_address = self._parse_group_created_event(receipt)
             
             if not group_address:
                 return {'success': False, 'error': 'Could not extract group address from transaction'}
             
-            verification_result['group_address'] = group_address
+            verification_result['group_address'] = group_address.lower()
+            # The new group isn't in a getAllGroups() snapshot taken before
+            # this block; drop it so verify_group_exists sees it right away
+            Web3JoinFunctions._groups_cache = (0.0, None)
             return verification_result
             
         except Exception as e:
@@ -427,6 +678,12 @@ class Web3JoinFunctions():
     async def verify_join_transaction(self, tx_hash: str, group_address: str, user_address: str) -> Dict[str, Any]:
         """Verify that a join transaction was successful"""
         logger.info(f"Starting join transaction verification - TX: {tx_hash}, Group: {group_address}, User: {user_address}")
+
+        cache_key = (tx_hash.lower(), group_address.lower(), user_address.lower())
+        cached = self._verified_joins.get(cache_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            logger.info("Join transaction already verified, using cached result")
+            return dict(cached[1])
         
         try:
             # Verify basic transaction
@@ -455,11 +712,11 @@ class Web3JoinFunctions():
             # Additional verification: check if user is now a member
             logger.info(f"Checking if user is member on contract...")
             try:
-                group_contract = self._get_group_contract(group_address)
+                group_contract = self._get_async_group_contract(group_address)
                 checksum_address = to_checksum_address(user_address)
                 logger.info(f"Calling isMember for address: {checksum_address}")
                 
-                is_member = group_contract.functions.getMemberDetails(checksum_address).call()
+                is_member = await group_contract.functions.getMemberDetails(checksum_address).call()
                 logger.info(f"isMember result: {is_member}")
                 
                 if not is_member:
@@ -470,25 +727,58 @@ class Web3JoinFunctions():
                 return {'success': False, 'error': f'Failed to verify membership: {str(contract_error)}'}
             
             logger.info("Join transaction verification successful")
+            self._verified_joins[cache_key] = (time.monotonic() + self.VERIFIED_TX_TTL, verification_result)
+            self._verified_joins.move_to_end(cache_key)
+            while len(self._verified_joins) > self.VERIFIED_TX_CACHE_SIZE:
+                self._verified_joins.popitem(last=False)
             return verification_result
             
         except Exception as e:
             logger.error(f"Join transaction verification failed with exception: {str(e)}", exc_info=True)
             return {'success': False, 'error': str(e)}
 
+    async def prewarm_join_verification(self, tx_hash: str, group_address: str, user_address: str) -> Dict[str, Any]:
+        """Wait for a just-broadcast join tx to mine, then verify it into the cache.
+
+        verify_join_transaction only looks the receipt up once, so running it
+        straight after broadcast fails while the tx is pending and caches
+        nothing. Shares the receipt wait with wait_for_transaction_confirmation.
+        """
+        try:
+            await self._single_flight(
+                f"wait:{tx_hash.lower()}",
+                functools.partial(self._await_receipt, tx_hash, self.JOIN_PREWARM_TIMEOUT)
+            )
+        except TimeExhausted:
+            logger.warning("Join tx %s not mined within %ss; skipping pre-verification", tx_hash, self.JOIN_PREWARM_TIMEOUT)
+            return {'success': False, 'error': 'Transaction still pending'}
+        except Exception as e:
+            logger.warning("Waiting for join tx %s failed: %s", tx_hash, e)
+            return {'success': False, 'error': str(e)}
+        return await self.verify_join_transaction(tx_hash, group_address, user_address)
+
 
     async def verify_user_transaction(self, tx_hash: str, user_address: str, contract_address: str) -> Dict[str, Any]:
         """Verify a user transaction on the blockchain"""
+        result, _ = await self._verify_user_transaction(tx_hash, user_address, contract_address)
+        return result
+
+    async def _verify_user_transaction(self, tx_hash: str, user_address: str, contract_address: str) -> Tuple[Dict[str, Any], Optional[Any]]:
+        """verify_user_transaction plus the receipt it fetched (None if it has none), for callers that parse its logs"""
         logger.info(f"Verifying user transaction - TX: {tx_hash}, User: {user_address}, Contract: {contract_address}")
         
+        tx_receipt = None
         try:
             # Get transaction receipt
             logger.info(f"Fetching transaction receipt for {tx_hash}...")
-            tx_receipt = self.w3.eth.get_transaction_receipt(tx_hash)
+            tx_receipt = await self._single_flight(
+                f"receipt:{tx_hash.lower()}",
+                functools.partial(self._fetch_receipt, tx_hash)
+            )
             
             if not tx_receipt:
                 logger.error(f"Transaction receipt not found for {tx_hash}")
-                return {'success': False, 'error': 'Transaction not found'}
+                return {'success': False, 'error': 'Transaction not found'}, tx_receipt
             
             logger.info(f"Transaction receipt status: {tx_receipt['status']}")
             logger.info(f"Transaction from: {tx_receipt.get('from')}, to: {tx_receipt.get('to')}")
@@ -509,7 +799,7 @@ class Web3JoinFunctions():
                     'error': error_message,
                     'status': tx_receipt['status'],
                     'gas_used': tx_receipt['gasUsed']
-                }
+                }, tx_receipt
             
             # Verify sender
             tx_from = tx_receipt.get('from', '').lower()
@@ -517,7 +807,7 @@ class Web3JoinFunctions():
             
             if tx_from != expected_from:
                 logger.error(f"Transaction sender mismatch - Expected: {expected_from}, Got: {tx_from}")
-                return {'success': False, 'error': f'Transaction not from user wallet (expected: {expected_from}, got: {tx_from})'}
+                return {'success': False, 'error': f'Transaction not from user wallet (expected: {expected_from}, got: {tx_from})'}, tx_receipt
             
             # Verify recipient (contract address)
             tx_to = tx_receipt.get('to', '').lower()
@@ -525,20 +815,22 @@ class Web3JoinFunctions():
             
             if tx_to != expected_to:
                 logger.error(f"Transaction recipient mismatch - Expected: {expected_to}, Got: {tx_to}")
-                return {'success': False, 'error': f'Transaction not to group contract (expected: {expected_to}, got: {tx_to})'}
+                return {'success': False, 'error': f'Transaction not to group contract (expected: {expected_to}, got: {tx_to})'}, tx_receipt
             
             logger.info("Transaction verification successful")
+            # State the cached estimates were simulated against may have moved
+            self._gas_estimates.clear()
             
             return {
                 'success': True,
                 'tx_hash': tx_hash,
                 'block_number': tx_receipt['blockNumber'],
                 'gas_used': tx_receipt['gasUsed']
-            }
+            }, tx_receipt
             
         except Exception as e:
             logger.error(f"Error verifying transaction {tx_hash}: {str(e)}", exc_info=True)
-            return {'success': False, 'error': str(e)}
+            return {'success': False, 'error': str(e)}, tx_receipt
 
 
     async def _get_revert_reason(self, tx_hash: str, tx_receipt: dict) -> str:
@@ -547,7 +839,7 @@ class Web3JoinFunctions():
         """
         try:
             # Get the original transaction
-            tx = self.w3.eth.get_transaction(tx_hash)
+            tx = await self.async_w3.eth.get_transaction(tx_hash)
             
             logger.info(f"Attempting to decode revert reason for tx {tx_hash}")
             logger.info(f"Transaction input: {tx['input'][:66]}...")  # First 66 chars (0x + 32 bytes)
@@ -567,7 +859,7 @@ class Web3JoinFunctions():
                 block_number = tx_receipt['blockNumber'] - 1
                 
                 logger.info(f"Replaying transaction at block {block_number}")
-                self.w3.eth.call(call_params, block_number)
+                await self.async_w3.eth.call(call_params, block_number)
                 
                 # If we get here, the call succeeded (shouldn't happen for a failed tx)
                 return "Reason: Unknown (call succeeded in replay)"
@@ -601,6 +893,80 @@ class Web3JoinFunctions():
             return "Reason: Could not determine (check smart contract logs)"
 
 
+    def _multicall3(self):
+        """Multicall3 contract on the async client"""
+        return self.async_w3.eth.contract(address=to_checksum_address(MULTICALL3_ADDRESS), abi=_MULTICALL3_ABI)
+
+    async def _aggregate3(self, calls: List[tuple]) -> List[tuple]:
+        """Run [(target, callData), ...] as one aggregate3 eth_call with allowFailure set.
+
+        Every call reads the same block; returns (success, returnData) per call.
+        """
+        return await self._multicall3().functions.aggregate3(
+            [(target, True, data) for target, data in calls]
+        ).call()
+
+    async def _join_diagnostic_reads(self, group_address: str, checksum_user: str) -> Dict[str, Any]:
+        """The diagnose_join_failure views plus the user's balance, as {name: decoded outputs or exception}.
+
+        One Multicall3 eth_call, so every field comes from the same block.
+        Each entry is built and decoded on its own, so a view that can't be
+        encoded or reverts only fails its own entry. Where Multicall3 isn't
+        deployed the reads are issued concurrently instead.
+        """
+        group_contract = self._get_group_contract(group_address)
+        reads: Dict[str, Any] = {}
+        calls = []
+        for fn_name, outputs, takes_user in _JOIN_DIAGNOSTIC_CALLS:
+            try:
+                data = HexBytes(group_contract.encodeABI(fn_name=fn_name, args=[checksum_user] if takes_user else None))
+            except Exception as e:
+                reads[fn_name] = e
+                continue
+            calls.append((fn_name, outputs, takes_user, data))
+
+        try:
+            multicall = self._multicall3()
+            balance_data = HexBytes(multicall.encodeABI(fn_name='getEthBalance', args=[checksum_user]))
+            replies = await self._aggregate3(
+                [(group_contract.address, data) for _, _, _, data in calls] + [(multicall.address, balance_data)]
+            )
+        except Exception as e:
+            logger.warning(f"Multicall3 unavailable, falling back to concurrent calls: {e}")
+            return await self._join_diagnostic_reads_concurrent(group_address, checksum_user, reads, calls)
+
+        for (name, outputs, _, _), (ok, data) in zip(calls + [('balance', ['uint256'], None, None)], replies):
+            if not ok or not data:
+                reads[name] = ValueError(f"{name} call reverted")
+                continue
+            try:
+                reads[name] = self.w3.codec.decode(outputs, data)
+            except Exception as e:
+                reads[name] = e
+        return reads
+
+    async def _join_diagnostic_reads_concurrent(self, group_address: str, checksum_user: str,
+                                                reads: Dict[str, Any], calls: List[tuple]) -> Dict[str, Any]:
+        """_join_diagnostic_reads without Multicall3: the same entries as concurrent eth_calls"""
+        async_contract = self._get_async_group_contract(group_address)
+        names, pending = [], []
+        for fn_name, _, takes_user, _ in calls:
+            try:
+                fn = getattr(async_contract.functions, fn_name)
+                pending.append(fn(*([checksum_user] if takes_user else [])).call())
+            except Exception as e:
+                reads[fn_name] = e
+                continue
+            names.append(fn_name)
+        values = await asyncio.gather(
+            *pending, self.async_w3.eth.get_balance(checksum_user), return_exceptions=True
+        )
+        for name, value in zip(names + ['balance'], values):
+            # Single-output views come back bare; keep every entry a tuple
+            # like the decoded Multicall3 replies
+            reads[name] = value if isinstance(value, (Exception, list, tuple)) else (value,)
+        return reads
+
     async def diagnose_join_failure(self, group_address: str, user_address: str) -> Dict[str, Any]:
         """
         Diagnose why a user might not be able to join a group
@@ -609,60 +975,64 @@ class Web3JoinFunctions():
         try:
             logger.info(f"Diagnosing join failure for user {user_address} joining group {group_address}")
             
-            group_contract = self._get_group_contract(group_address)
             checksum_user = to_checksum_address(user_address)
+            reads = await self._join_diagnostic_reads(group_address, checksum_user)
             
             # Check various conditions
             diagnostics = {}
             
             # 1. Check if already a member
-            try:
-                is_member = group_contract.functions.isMember(checksum_user).call()
+            details = reads['getMemberDetails']
+            if isinstance(details, Exception):
+                diagnostics['is_already_member'] = f"Error: {str(details)}"
+            else:
+                # getMemberDetails -> (exists, active, joinedAt, ...)
+                is_member = details[0]
                 diagnostics['is_already_member'] = is_member
                 logger.info(f"Is already member: {is_member}")
-            except Exception as e:
-                diagnostics['is_already_member'] = f"Error: {str(e)}"
+            
+            # rules -> (name, contributionAmount, frequency, maxMembers, ..., approvalRequired, ...)
+            rules = reads['rules']
             
             # 2. Check member count vs max members
-            try:
-                member_count = group_contract.functions.getMemberCount().call()
-                max_members = group_contract.functions.maxMembers().call()
+            count = reads['memberCount']
+            failed = next((r for r in (count, rules) if isinstance(r, Exception)), None)
+            if failed is not None:
+                diagnostics['member_count_check'] = f"Error: {str(failed)}"
+            else:
+                member_count, max_members = count[0], rules[3]
                 diagnostics['member_count'] = member_count
                 diagnostics['max_members'] = max_members
                 diagnostics['is_full'] = member_count >= max_members
                 logger.info(f"Members: {member_count}/{max_members}, Full: {member_count >= max_members}")
-            except Exception as e:
-                diagnostics['member_count_check'] = f"Error: {str(e)}"
             
             # 3. Check if group is active
-            try:
-                is_active = group_contract.functions.isActive().call()
-                diagnostics['is_active'] = is_active
-                logger.info(f"Group is active: {is_active}")
-            except Exception as e:
-                diagnostics['is_active'] = f"Error: {str(e)}"
+            is_active = reads['isActive']
+            if isinstance(is_active, Exception):
+                diagnostics['is_active'] = f"Error: {str(is_active)}"
+            else:
+                diagnostics['is_active'] = is_active[0]
+                logger.info(f"Group is active: {is_active[0]}")
             
             # 4. Check approval requirements
-            try:
-                approval_required = group_contract.functions.approvalRequired().call()
-                diagnostics['approval_required'] = approval_required
-                logger.info(f"Approval required: {approval_required}")
-            except Exception as e:
-                diagnostics['approval_required'] = f"Error: {str(e)}"
-            
-            # 5. Check contribution amount
-            try:
-                contribution_amount = group_contract.functions.contributionAmount().call()
+            if isinstance(rules, Exception):
+                diagnostics['approval_required'] = f"Error: {str(rules)}"
+            else:
+                diagnostics['approval_required'] = rules[7]
+                logger.info(f"Approval required: {rules[7]}")
+            
+            # 5. Check contribution amount against the user's balance
+            balance = reads['balance']
+            failed = next((r for r in (rules, balance) if isinstance(r, Exception)), None)
+            if failed is not None:
+                diagnostics['contribution_check'] = f"Error: {str(failed)}"
+            else:
+                contribution_amount, balance = rules[1], balance[0]
                 diagnostics['contribution_amount'] = str(contribution_amount)
-                logger.info(f"Contribution amount: {contribution_amount}")
-                
-                # Check user's balance
-                balance = self.w3.eth.get_balance(checksum_user)
                 diagnostics['user_balance'] = str(balance)
                 diagnostics['has_sufficient_balance'] = balance >= contribution_amount
+                logger.info(f"Contribution amount: {contribution_amount}")
                 logger.info(f"User balance: {balance}, Sufficient: {balance >= contribution_amount}")
-            except Exception as e:
-                diagnostics['contribution_check'] = f"Error: {str(e)}"
             
             return {
                 'success': True,
@@ -719,28 +1089,43 @@ class Web3JoinFunctions():
             
             group_contract = self._get_group_contract(group_address)
             
-            # Build transaction
-            nonce = self.w3.eth.get_transaction_count(self.admin_account.address)
-            tx_params: TxParams = {
-                'from': self.admin_account.address,
-                'nonce': nonce,
-                'gasPrice': Wei(self._get_gas_price()),
-            }
-            transaction = group_contract.functions.approveJoinRequest(
-                to_checksum_address(applicant_address)
-            ).build_transaction(tx_params)
-            
-            # Estimate gas
-            transaction['gas'] = self._estimate_gas_for_user(transaction, self.admin_account.address)
-            
-            # Sign and send transaction
-            signed_txn = self.w3.eth.account.sign_transaction(transaction, private_key=self.private_key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            # Build transaction — nonce and EIP-1559 fees come from the shared
+            # service's local counter and fee cache. Both may hit the node
+            # (first nonce after a reset, fee cache miss) and next_nonce holds
+            # a threading lock, so they run off the event loop
+            nonce = await asyncio.to_thread(web3_service.next_nonce)
+            try:
+                tx_params: TxParams = {
+                    'from': self.admin_account.address,
+                    'nonce': nonce,
+                    **await asyncio.to_thread(web3_service.fee_params),
+                }
+                transaction = await asyncio.to_thread(
+                    group_contract.functions.approveJoinRequest(
+                        to_checksum_address(applicant_address)
+                    ).build_transaction,
+                    tx_params
+                )
+                
+                # Estimate gas
+                transaction['gas'] = await asyncio.to_thread(
+                    self._estimate_gas_for_user, transaction, self.admin_account.address
+                )
+                
+                # Sign off the event loop — secp256k1 signing and RLP encoding are CPU-bound
+                signed_txn = await asyncio.to_thread(
+                    self.w3.eth.account.sign_transaction, transaction, self.private_key
+                )
+                tx_hash = await asyncio.to_thread(self.w3.eth.send_raw_transaction, signed_txn.rawTransaction)
+            except Exception:
+                # The nonce never reached the chain; resync before the next send
+                web3_service.reset_nonce()
+                raise
             
             logger.info(f"Admin approval transaction sent: {tx_hash.hex()}")
             
             # Wait for transaction receipt
-            receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+            receipt = await self._await_receipt(tx_hash, timeout=300)
             
             if receipt['status'] == 0:
                 return {'success': False, 'error': 'Transaction failed'}
@@ -764,7 +1149,7 @@ class Web3JoinFunctions():
     async def get_gas_estimates(self) -> Dict[str, Any]:
         """Get current gas price estimates for frontend"""
         try:
-            current_gas_price = self._get_gas_price()
+            current_gas_price = await self._get_gas_price_async()
             
             return {
                 'success': True,
@@ -814,8 +1199,8 @@ class Web3JoinFunctions():
             if not self.validate_address(group_address) or not self.validate_address(member_address):
                 return {'success': False, 'error': 'Invalid address'}
             
-            group_contract = self._get_group_contract(group_address)
-            member = group_contract.functions.getMemberDetails(to_checksum_address(member_address)).call()
+            group_contract = self._get_async_group_contract(group_address)
+            member = await group_contract.functions.getMemberDetails(to_checksum_address(member_address)).call()
             logger.info(
                 f"Member details for {to_checksum_address(member_address)} -> "
                 f"exists: {member[0]}, "
@@ -879,10 +1264,10 @@ class Web3JoinFunctions():
             if not self.validate_address(group_address):
                 return {'success': False, 'error': 'Invalid group address'}
             
-            group_contract = self._get_group_contract(group_address)
+            group_contract = self._get_async_group_contract(group_address)
             
             # Get basic group info
-            member_count = group_contract.functions.memberCount().call()
+            member_count = await group_contract.functions.memberCount().call()
             
             # Try to get max members (this might not be directly available in all contracts)
             try:
@@ -896,8 +1281,7 @@ class Web3JoinFunctions():
             is_full = max_members > 0 and member_count >= max_members
             
             # Get current block time for status checks
-            current_block = self.w3.eth.block_number
-            block = self.w3.eth.get_block(current_block)
+            block = await self.async_w3.eth.get_block('latest')
             current_time = block.timestamp
             
             return {
@@ -919,39 +1303,42 @@ class Web3JoinFunctions():
             if not self.validate_address(group_address):
                 return 0
             
-            group_contract = self._get_group_contract(group_address)
-            return group_contract.functions.memberCount().call()
+            group_contract = self._get_async_group_contract(group_address)
+            return await group_contract.functions.memberCount().call()
             
         except Exception as e:
             logger.error(f"Error getting member count: {e}")
             return 0
 
     def _parse_group_created_event(self, receipt) -> Optional[str]:
-        """Parse GroupCreated event from transaction receipt"""
+        """Parse GroupCreated event from transaction receipt (checksummed group address)"""
         try:
-            for log in receipt.logs:
-                if log.address.lower() == self.factory_address.lower():
-                    try:
-                        decoded_log = self.factory_contract.events.GroupCreated().process_log(log)
-                        return decoded_log.args.groupAddress.lower()
-                    except Exception as e:
-                        logger.warning(f"Error processing log: {e}")
-                        continue
-            
+            factory = self.factory_contract.address
+            for log in receipt['logs']:
+                topics = log['topics']
+                if len(topics) > 2 and topics[0] == self.group_created_topic and log['address'] == factory:
+                    # groupAddress is the second indexed argument: topics[2], left-padded
+                    return to_checksum_address(HexBytes(topics[2])[-20:])
+                        
             logger.warning("GroupCreated event not found in transaction logs")
             return None
         except Exception as e:
             logger.error(f"Error parsing events: {e}")
             return None
 
-    async def get_blockchain_groups(self) -> List[str]:
-        """Get all group addresses from blockchain"""
+    async def get_blockchain_groups(self) -> frozenset:
+        """Get all group addresses from blockchain (lowercased, cached for BLOCKCHAIN_GROUPS_TTL seconds)"""
+        expiry, cached = Web3JoinFunctions._groups_cache
+        if cached is not None and time.monotonic() < expiry:
+            return cached
         try:
-            group_addresses = self.factory_contract.functions.getAllGroups().call()
-            return [address.lower() for address in group_addresses]
+            group_addresses = await self.async_factory_contract.functions.getAllGroups().call()
+            groups = frozenset(map(_norm_address, group_addresses))
+            Web3JoinFunctions._groups_cache = (time.monotonic() + self.BLOCKCHAIN_GROUPS_TTL, groups)
+            return groups
         except Exception as e:
             logger.error(f"Error fetching blockchain groups: {e}")
-            return []
+            return frozenset()
 
     async def get_creator_groups_from_blockchain(self, creator_address: str) -> List[str]:
         """Get groups created by a specific address"""
@@ -960,8 +1347,8 @@ class Web3JoinFunctions():
                 raise ValueError("Invalid creator address")
             
             creator_address = to_checksum_address(creator_address)
-            group_addresses = self.factory_contract.functions.getCreatorGroups(creator_address).call()
-            return [address.lower() for address in group_addresses]
+            group_addresses = await self.async_factory_contract.functions.getCreatorGroups(creator_address).call()
+            return list(map(_norm_address, group_addresses))
         except Exception as e:
             logger.error(f"Error fetching creator groups for {creator_address}: {e}")
             return []
@@ -976,7 +1363,7 @@ class Web3JoinFunctions():
             
             # Try to get info from factory contract first
             try:
-                info = self.factory_contract.functions.getGroupInfo(group_address).call()
+                info = await self.async_factory_contract.functions.getGroupInfo(group_address).call()
                 return {
                     'name': info[0],
                     'creator': info[1].lower(),
@@ -987,8 +1374,8 @@ class Web3JoinFunctions():
             except Exception:
                 # Try to get info directly from group contract
                 try:
-                    group_contract = self._get_group_contract(group_address)
-                    member_count = group_contract.functions.memberCount().call()
+                    group_contract = self._get_async_group_contract(group_address)
+                    member_count = await group_contract.functions.memberCount().call()
                     return {
                         'address': group_address.lower(),
                         'current_members': member_count,
@@ -1008,7 +1395,7 @@ class Web3JoinFunctions():
         """Verify if a group exists on blockchain"""
         try:
             all_groups = await self.get_blockchain_groups()
-            return group_address.lower() in all_groups
+            return _norm_address(group_address) in all_groups
         except Exception as e:
             logger.error(f"Error verifying group existence: {e}")
             return False
@@ -1022,8 +1409,10 @@ class Web3JoinFunctions():
             # Convert to HexBytes for proper type handling
             hash_bytes = HexBytes(tx_hash)
             
-            receipt = self.w3.eth.get_transaction_receipt(hash_bytes)
-            transaction = self.w3.eth.get_transaction(hash_bytes)
+            receipt, transaction = await asyncio.gather(
+                self.async_w3.eth.get_transaction_receipt(hash_bytes),
+                self.async_w3.eth.get_transaction(hash_bytes)
+            )
             
             return {
                 'hash': tx_hash,
@@ -1043,9 +1432,11 @@ class Web3JoinFunctions():
     async def get_network_info(self) -> Dict[str, Any]:
         """Get network information"""
         try:
-            chain_id = self.w3.eth.chain_id
-            latest_block = self.w3.eth.block_number
-            gas_price = self.w3.eth.gas_price
+            chain_id, latest_block, gas_price = await asyncio.gather(
+                web3_service.chain_id_async(),
+                self.async_w3.eth.block_number,
+                self.async_w3.eth.gas_price
+            )
             
             return {
                 'chain_id': chain_id,
@@ -1061,6 +1452,68 @@ class Web3JoinFunctions():
 
     
 
+    async def get_blockchain_stats(self) -> Dict[str, Any]:
+        """Factory and network state; the node reads go out as one JSON-RPC batch.
+
+        Group addresses come from the get_blockchain_groups TTL cache. Fields
+        the node can't answer degrade to 0 / {} and network_connected reports
+        whether it answered at all.
+        """
+        factory = self.factory_contract.address
+        all_groups, batch = await asyncio.gather(
+            self.get_blockchain_groups(),
+            self.rpc_batch([
+                ('eth_call', [{'to': factory, 'data': self.factory_contract.encodeABI(fn_name='groupCounter')}, 'latest']),
+                ('eth_blockNumber', []),
+                ('eth_gasPrice', []),
+            ]),
+            return_exceptions=True,
+        )
+        if isinstance(batch, Exception):
+            # Some providers reject or serialize batches, or the node is down;
+            # issue the same calls concurrently and keep whatever answers
+            logger.warning(f"RPC batch unavailable, falling back to concurrent calls: {batch}")
+            replies = await asyncio.gather(
+                self.async_factory_contract.functions.groupCounter().call(),
+                self.async_w3.eth.block_number,
+                self.async_w3.eth.gas_price,
+                return_exceptions=True,
+            )
+        else:
+            raw_counter, block_number, gas_price = batch
+            replies = (
+                self.w3.codec.decode(['uint256'], HexBytes(raw_counter))[0],
+                int(block_number, 16),
+                int(gas_price, 16),
+            )
+        group_counter, latest_block, gas_price = (
+            None if isinstance(reply, Exception) else reply for reply in replies
+        )
+        network_connected = latest_block is not None
+
+        network_info = {}
+        if network_connected and gas_price is not None:
+            try:
+                network_info = {
+                    'chain_id': await web3_service.chain_id_async(),
+                    'latest_block': latest_block,
+                    'gas_price': str(gas_price),
+                    'gas_price_gwei': self.w3.from_wei(gas_price, 'gwei'),
+                    'provider_url': self.provider_url,
+                    'factory_address': self.factory_address
+                }
+            except Exception as e:
+                logger.error(f"Error getting network info: {e}")
+
+        return {
+            'total_groups': len(all_groups) if isinstance(all_groups, frozenset) else 0,
+            'group_counter': group_counter or 0,
+            'factory_address': self.factory_address,
+            'network_connected': network_connected,
+            'latest_block': latest_block or 0,
+            'network_info': network_info
+        }
+
     def get_latest_block_number(self) -> int:
         """Get the latest block number"""
         try:
@@ -1077,8 +1530,24 @@ class Web3JoinFunctions():
             logger.error(f"Error getting group counter: {e}")
             return 0
 
-    def validate_address(self, address: str) -> bool:
-        """Validate Ethereum address format"""
+    # Off-loop wrappers for the sync helpers above so async callers don't
+    # stall every other request for an RPC round trip
+    async def get_latest_block_number_async(self) -> int:
+        return await asyncio.to_thread(self.get_latest_block_number)
+
+    async def get_group_counter_async(self) -> int:
+        return await asyncio.to_thread(self.get_group_counter)
+
+    def validate_address(self, address: str, validate_checksum: bool = False) -> bool:
+        """Validate Ethereum address format.
+
+        Format only by default; validate_checksum=True also runs eth_utils'
+        is_address, which keccak-checks mixed-case (EIP-55) input.
+        """
+        if not isinstance(address, str) or ETH_ADDRESS_RE.match(address) is None:
+            return False
+        if not validate_checksum:
+            return True
         try:
             return is_address(address)
         except Exception:
@@ -1087,7 +1556,9 @@ class Web3JoinFunctions():
     def get_account_balance(self, address: Optional[str] = None) -> Dict[str, Any]:
         """Get account balance"""
         try:
-            target_address = address or self.account.address
+            if address is None and self.admin_account is None:
+                return {'error': 'No admin account configured'}
+            target_address = address or self.admin_account.address
             if not self.validate_address(target_address):
                 return {'error': 'Invalid address'}
             
@@ -1104,19 +1575,36 @@ class Web3JoinFunctions():
             logger.error(f"Error getting balance: {e}")
             return {'error': str(e)}
 
+    async def get_account_balance_async(self, address: Optional[str] = None) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.get_account_balance, address)
+
     async def batch_verify_groups(self, group_addresses: List[str]) -> Dict[str, bool]:
         """Batch verify multiple groups"""
+        normalized = list(map(_norm_address, group_addresses))
         try:
             all_groups = await self.get_blockchain_groups()
-            result = {}
-            
-            for address in group_addresses:
-                result[address.lower()] = address.lower() in all_groups
-            
-            return result
+            if all_groups:
+                return dict(zip(normalized, map(all_groups.__contains__, normalized)))
+
+            # No getAllGroups() snapshot (fetch failed or factory is empty):
+            # ask the factory per address, concurrently but bounded
+            semaphore = asyncio.Semaphore(self.VERIFY_CONCURRENCY)
+
+            async def check_one(address: str) -> bool:
+                if not self.validate_address(address):
+                    return False
+                async with semaphore:
+                    return await self.async_factory_contract.functions.isValidGroup(
+                        to_checksum_address(address)
+                    ).call()
+
+            results = await asyncio.gather(
+                *(check_one(a) for a in group_addresses), return_exceptions=True
+            )
+            return {a: r is True for a, r in zip(normalized, results)}
         except Exception as e:
             logger.error(f"Error in batch verification: {e}")
-            return {addr.lower(): False for addr in group_addresses}
+            return dict.fromkeys(normalized, False)
 
     def __str__(self) -> str:
         return f"Web3Service(provider={self.provider_url}, factory={self.factory_address}, connected={self.is_connected()})"